@@ -0,0 +1,73 @@
+"""Persistent on-disk cache of section translations.
+
+Re-running the same paper (say, to compare tone levels) shouldn't pay for
+sections that were already translated with identical settings. Entries are
+keyed on a hash of the section text plus tone, prompt, model, and provider,
+and live in a single SQLite file under ``~/.cache/millennialifier/``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "millennialifier"
+_CACHE_FILE = _CACHE_DIR / "translations.sqlite3"
+
+_conn: sqlite3.Connection | None = None
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database on first use."""
+    global _conn
+    if _conn is None:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(_CACHE_FILE, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+    return _conn
+
+
+def make_key(
+    heading: str, content: str, tone: int, model: str, provider: str, prompt: str
+) -> str:
+    """Build the cache key for one section translated with the given settings.
+
+    ``prompt`` is the prompt wording the translation was made with, so
+    editing a prompt invalidates what was cached under the old one.
+    """
+    raw = "\0".join((heading, content, str(int(tone)), model, provider, prompt))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get(key: str) -> str | None:
+    """Return the cached translation for ``key``, or None on a miss."""
+    try:
+        row = _connect().execute(
+            "SELECT value FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None  # An unusable cache just means a miss
+    return row[0] if row else None
+
+
+def put(key: str, value: str) -> None:
+    """Store a translation under ``key``, replacing any previous entry.
+
+    Empty translations (a blocked or failed reply) are never stored, so
+    they get retried next time instead of being served forever.
+    """
+    if not value:
+        return
+    try:
+        conn = _connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+    except (OSError, sqlite3.Error):
+        pass
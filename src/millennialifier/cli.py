@@ -3,17 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import glob
+import re
 from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from millennialifier.models import ToneLevel
-from millennialifier.parsers.fetcher import fetch_paper
-from millennialifier.translator import translate_paper
+from millennialifier.models import Paper, Section, ToneLevel
+from millennialifier.providers import PROVIDER_INFO, close_providers
 
 app = typer.Typer(
     name="millenialify",
@@ -23,15 +22,17 @@ app = typer.Typer(
 
 console = Console()
 
+_PROVIDER = "gemini"
+_MODEL = PROVIDER_INFO[_PROVIDER].default_model
 
-def _tone_name(tone: ToneLevel) -> str:
-    return {
-        ToneLevel.LIGHT: "Light",
-        ToneLevel.MODERATE: "Moderate",
-        ToneLevel.BALANCED: "Balanced",
-        ToneLevel.HEAVY: "Heavy",
-        ToneLevel.UNHINGED: "UNHINGED",
-    }[tone]
+
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop when it's installed ([cli] extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
 
 
 @app.command()
@@ -53,6 +54,40 @@ def translate(
         "-o",
         help="Write output to a markdown file instead of stdout.",
     ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum number of sections translated at the same time (defaults to the provider's cap).",
+    ),
+    rpm: int | None = typer.Option(
+        None,
+        "--rpm",
+        min=0,
+        help="Requests-per-minute cap (defaults to the provider's free-tier limit, 0 disables).",
+    ),
+    pack_tokens: int = typer.Option(
+        0,
+        "--pack-tokens",
+        min=0,
+        help="Pack consecutive short sections into one request of up to this many tokens (0 disables).",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Don't read or write the on-disk translation cache.",
+    ),
+    refresh_cache: bool = typer.Option(
+        False,
+        "--refresh-cache",
+        help="Ignore cached translations and overwrite them with fresh ones.",
+    ),
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        help="Submit all sections as one discounted provider batch job (may take hours).",
+    ),
 ) -> None:
     """Translate a research paper into millennial speak."""
     tone_level = ToneLevel(tone)
@@ -61,20 +96,47 @@ def translate(
         Panel(
             f"[bold]Paper Millennial-ifier[/bold]\n"
             f"Source: {source}\n"
-            f"Model: gemini-2.0-flash\n"
-            f"Tone: {_tone_name(tone_level)} ({tone}/5)",
+            f"Model: {_MODEL}\n"
+            f"Tone: {tone_level.display_name} ({tone}/5)",
             border_style="cyan",
         )
     )
 
-    asyncio.run(_run_translation(source, tone_level, output))
+    _run_async(
+        _run_translation(
+            source,
+            tone_level,
+            output,
+            concurrency=concurrency,
+            rpm=rpm,
+            pack_tokens=pack_tokens,
+            use_cache=not no_cache,
+            refresh_cache=refresh_cache,
+            use_batch_job=batch,
+        )
+    )
 
 
 async def _run_translation(
     source: str,
     tone: ToneLevel,
     output: Path | None,
+    concurrency: int | None = None,
+    rpm: int | None = None,
+    pack_tokens: int = 0,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    use_batch_job: bool = False,
 ) -> None:
+    # Heavy imports (PDF/HTML parsers, httpx, Rich rendering) are deferred to
+    # here so `--help` and `tones` start quickly.
+    from rich.markdown import Markdown
+    from rich.markup import escape
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from millennialifier.parsers.fetcher import close_client, fetch_paper
+    from millennialifier.translator import needs_translation, translate_paper
+
     # Parse
     with Progress(
         SpinnerColumn(),
@@ -82,7 +144,10 @@ async def _run_translation(
         console=console,
     ) as progress:
         task = progress.add_task("Fetching and parsing paper...", total=None)
-        paper = await fetch_paper(source)
+        try:
+            paper = await fetch_paper(source)
+        finally:
+            await close_client()
         progress.update(task, description="[green]Paper parsed!")
 
     console.print(f"\n[bold]{paper.title}[/bold]")
@@ -90,50 +155,265 @@ async def _run_translation(
         console.print(f"[dim]{', '.join(paper.authors)}[/dim]")
 
     sections = paper.all_sections()
-    console.print(f"Found [cyan]{len(sections)}[/cyan] sections to translate.\n")
+    to_translate = sum(1 for s in sections if needs_translation(s))
+    console.print(f"Found [cyan]{to_translate}[/cyan] sections to translate.")
+    if to_translate < len(sections):
+        console.print(f"[dim]Keeping {len(sections) - to_translate} short or reference sections as-is.[/dim]")
+    console.print()
 
-    # Translate section by section with progress
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Translating...", total=len(sections))
+    # Sections finish out of order, so hold each one back until everything
+    # before it has been written — output streams in paper order.
+    out = output.open("w", encoding="utf-8", buffering=1 << 16) if output else None
+    pending: dict[int, Section] = {}
+    next_index = 0
 
-        def on_start(i: int, heading: str) -> None:
-            progress.update(task, description=f"Translating: {heading}")
+    # Rendering Markdown only pays off on a terminal; when piped, pass the
+    # raw markdown through instead of parsing it into plain wrapped text.
+    render = console.is_terminal
 
-        def on_done(i: int, heading: str) -> None:
-            progress.advance(task)
+    def emit(text: str) -> None:
+        if out:
+            out.write(text)
+        elif render:
+            console.print(Markdown(text))
+        else:
+            console.out(text, highlight=False, end="")
 
-        paper = await translate_paper(
-            paper,
-            tone=tone,
-            on_section_start=on_start,
-            on_section_done=on_done,
-        )
+    def on_translated(i: int, section: Section) -> None:
+        nonlocal next_index
+        pending[i] = section
+        while next_index in pending:
+            ready = pending.pop(next_index)
+            emit(f"\n## {ready.heading}\n\n{ready.translated or ready.content}\n")
+            next_index += 1
+
+    try:
+        emit(f"# {paper.title}\n")
 
-    # Build output
-    lines: list[str] = []
-    lines.append(f"# {paper.title}\n")
+        # Built once up front: callbacks can fire in quick bursts (cache hits,
+        # packed groups), and Rich's 8 Hz refresh coalesces the redraws.
+        descriptions = [f"Translating: {escape(s.heading)}" for s in sections]
 
-    if paper.abstract:
-        lines.append("## Abstract\n")
-        lines.append(paper.abstract + "\n")
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            refresh_per_second=8,
+            transient=True,
+        ) as progress:
+            task = progress.add_task("Translating...", total=to_translate)
 
-    for section in paper.sections:
-        text = section.translated or section.content
-        lines.append(f"## {section.heading}\n")
-        lines.append(text + "\n")
+            def on_start(i: int, heading: str) -> None:
+                progress.update(task, description=descriptions[i])
 
-    result = "\n".join(lines)
+            def on_done(i: int, heading: str) -> None:
+                progress.advance(task)
+
+            await translate_paper(
+                paper,
+                tone=tone,
+                on_section_start=on_start,
+                on_section_done=on_done,
+                on_section_translated=on_translated,
+                max_concurrency=concurrency,
+                rpm=rpm,
+                batch_budget=pack_tokens or None,
+                use_cache=use_cache,
+                refresh_cache=refresh_cache,
+                use_batch_job=use_batch_job,
+            )
+    finally:
+        if out:
+            out.close()
+        await close_providers()
 
     if output:
-        output.write_text(result, encoding="utf-8")
         console.print(f"\n[green]Saved to {output}[/green]")
-    else:
-        console.print()
-        console.print(Markdown(result))
+
+
+@app.command()
+def batch_translate(
+    sources: list[str] = typer.Argument(
+        help="URLs, file paths, or glob patterns (e.g. 'papers/*.pdf') to translate.",
+    ),
+    output_dir: Path = typer.Option(
+        Path("."),
+        "--output-dir",
+        "-d",
+        help="Directory to write one <name>.md file per paper into.",
+    ),
+    tone: int = typer.Option(
+        3,
+        "--tone",
+        "-t",
+        min=1,
+        max=5,
+        help="Millennial intensity: 1=light, 2=moderate, 3=balanced, 4=heavy, 5=unhinged.",
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum number of sections in flight at once, across all papers (defaults to the provider's cap).",
+    ),
+    rpm: int | None = typer.Option(
+        None,
+        "--rpm",
+        min=0,
+        help="Requests-per-minute cap shared by all papers (defaults to the provider's limit, 0 disables).",
+    ),
+    pack_tokens: int = typer.Option(
+        0,
+        "--pack-tokens",
+        min=0,
+        help="Pack consecutive short sections into one request of up to this many tokens (0 disables).",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Don't read or write the on-disk translation cache.",
+    ),
+    refresh_cache: bool = typer.Option(
+        False,
+        "--refresh-cache",
+        help="Ignore cached translations and overwrite them with fresh ones.",
+    ),
+) -> None:
+    """Translate many papers at once, sharing one client and rate limit."""
+    expanded = _expand_sources(sources)
+    if not expanded:
+        console.print("[red]No papers matched.[/red]")
+        raise typer.Exit(1)
+
+    failures = _run_async(
+        _run_batch(
+            expanded,
+            ToneLevel(tone),
+            output_dir,
+            concurrency=concurrency,
+            rpm=rpm,
+            pack_tokens=pack_tokens,
+            use_cache=not no_cache,
+            refresh_cache=refresh_cache,
+        )
+    )
+    if failures:
+        raise typer.Exit(1)
+
+
+def _expand_sources(sources: list[str]) -> list[str]:
+    """Expand glob patterns in local paths; URLs and plain paths pass through."""
+    expanded: list[str] = []
+    for source in sources:
+        is_url = source.startswith(("http://", "https://"))
+        matches = sorted(glob.glob(source)) if not is_url and any(c in source for c in "*?[") else []
+        expanded.extend(matches or [source])
+    return expanded
+
+
+def _output_stem(source: str) -> str:
+    """Pick an output file name for a paper source."""
+    path = Path(source)
+    if path.exists():
+        return path.stem
+    tail = source.rstrip("/").rsplit("/", 1)[-1]
+    return re.sub(r"[^\w.-]+", "_", tail) or "paper"
+
+
+def _output_paths(sources: list[str], output_dir: Path) -> list[Path]:
+    """Pick one output file per source, numbering repeated names ("paper-2.md")."""
+    taken: set[str] = set()
+    paths: list[Path] = []
+    for source in sources:
+        stem = name = _output_stem(source)
+        n = 1
+        while name.casefold() in taken:  # Also safe on case-insensitive filesystems
+            n += 1
+            name = f"{stem}-{n}"
+        taken.add(name.casefold())
+        paths.append(output_dir / f"{name}.md")
+    return paths
+
+
+def _write_markdown(paper: Paper, path: Path) -> None:
+    """Write a translated paper as markdown, section by section."""
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as out:
+        out.write(f"# {paper.title}\n")
+        if paper.abstract:
+            out.write(f"\n## Abstract\n\n{paper.abstract}\n")
+        for section in paper.sections:
+            out.write(f"\n## {section.heading}\n\n{section.translated or section.content}\n")
+
+
+async def _run_batch(
+    sources: list[str],
+    tone: ToneLevel,
+    output_dir: Path,
+    concurrency: int | None = None,
+    rpm: int | None = None,
+    pack_tokens: int = 0,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> int:
+    """Translate every source concurrently. Returns the number that failed."""
+    from rich.markup import escape
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
+    from millennialifier.parsers.fetcher import close_client, fetch_paper
+    from millennialifier.providers import get_provider
+    from millennialifier.translator import concurrency_for, rate_limiter_for, translate_paper
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # One provider, concurrency cap, and rate limiter for every paper, so the
+    # connection pool is reused and the limits hold across the whole run.
+    llm = get_provider(_PROVIDER)
+    semaphore = asyncio.Semaphore(concurrency_for(llm.name, concurrency))
+    rate_limiter = rate_limiter_for(llm.name, rpm)
+    failures = 0
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        refresh_per_second=8,
+    ) as progress:
+        task = progress.add_task(f"Translating {len(sources)} papers...", total=len(sources))
+
+        async def translate_one(source: str, path: Path) -> None:
+            nonlocal failures
+            try:
+                paper = await fetch_paper(source)
+                await translate_paper(
+                    paper,
+                    tone=tone,
+                    provider=llm,
+                    batch_budget=pack_tokens or None,
+                    use_cache=use_cache,
+                    refresh_cache=refresh_cache,
+                    semaphore=semaphore,
+                    rate_limiter=rate_limiter,
+                )
+                _write_markdown(paper, path)
+            except Exception as exc:
+                failures += 1
+                progress.console.print(f"[red]Failed[/red] {escape(source)}: {escape(str(exc))}")
+            else:
+                progress.console.print(f"[green]Saved[/green] {escape(source)} -> {path}")
+            finally:
+                progress.advance(task)
+
+        try:
+            paths = _output_paths(sources, output_dir)
+            await asyncio.gather(*(translate_one(s, p) for s, p in zip(sources, paths)))
+        finally:
+            await close_client()
+            await close_providers()
+
+    return failures
 
 
 @app.command()
@@ -0,0 +1,36 @@
+"""Concurrency helpers for fanning out LLM requests without tripping rate limits."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+
+# Default cap on LLM requests in flight at once
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class AsyncLeakyBucket:
+    """Space out requests so no more than ``rate_per_min`` start per minute.
+
+    Each ``acquire()`` reserves the next free slot and sleeps until it
+    arrives, so bursts are smoothed into an even request rate instead of
+    hitting the provider all at once and bouncing off its 429s.
+    """
+
+    def __init__(self, rate_per_min: int) -> None:
+        if rate_per_min <= 0:
+            raise ValueError("rate_per_min must be a positive integer")
+        self.rate_per_min = rate_per_min
+        self._interval = 60.0 / rate_per_min
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = monotonic()
+            wait = self._next_slot - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = self._next_slot
+            self._next_slot = now + self._interval
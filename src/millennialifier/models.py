@@ -1,9 +1,14 @@
 """Data models for paper parsing and translation."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import IntEnum
 
 
+# Display names indexed by tone value (index 0 unused)
+_TONE_NAMES = ("", "Light", "Moderate", "Balanced", "Heavy", "UNHINGED")
+
+
 class ToneLevel(IntEnum):
     """How millennial the output should be. Scale of 1-5."""
 
@@ -13,8 +18,13 @@ class ToneLevel(IntEnum):
     HEAVY = 4       # Very casual, lots of slang and references
     UNHINGED = 5    # Full millennial chaos mode
 
+    @property
+    def display_name(self) -> str:
+        """Human-friendly name, e.g. "Balanced" or "UNHINGED"."""
+        return _TONE_NAMES[self.value]
 
-@dataclass
+
+@dataclass(slots=True)
 class Section:
     """A single section of a research paper."""
 
@@ -22,8 +32,12 @@ class Section:
     content: str
     translated: str | None = None
 
+    def __post_init__(self) -> None:
+        # Papers repeat the same few headings ("Introduction", "Results"...)
+        self.heading = sys.intern(self.heading)
+
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """A parsed research paper, ready for translation."""
 
@@ -2,6 +2,12 @@
 
 from millennialifier.parsers.pdf import PdfParser
 from millennialifier.parsers.html import HtmlParser
-from millennialifier.parsers.fetcher import fetch_paper
 
-__all__ = ["PdfParser", "HtmlParser", "fetch_paper"]
+# Parsers hold no per-document state, so one of each serves the whole app.
+# Defined before the fetcher import below, which uses them.
+pdf_parser = PdfParser()
+html_parser = HtmlParser()
+
+from millennialifier.parsers.fetcher import close_client, fetch_paper  # noqa: E402
+
+__all__ = ["PdfParser", "HtmlParser", "pdf_parser", "html_parser", "fetch_paper", "close_client"]
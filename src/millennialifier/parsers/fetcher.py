@@ -2,28 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import re
 from pathlib import Path
 
 import httpx
 
 from millennialifier.models import Paper
-from millennialifier.parsers.html import HtmlParser
-from millennialifier.parsers.pdf import PdfParser
+from millennialifier.parsers import html_parser, pdf_parser
 
-# arXiv abstract page: https://arxiv.org/abs/2301.12345
-_ARXIV_ABS_RE = re.compile(r"arxiv\.org/abs/([\w.]+)")
-# arXiv PDF page: https://arxiv.org/pdf/2301.12345
-_ARXIV_PDF_RE = re.compile(r"arxiv\.org/pdf/([\w.]+)")
+# arXiv abstract or PDF page: https://arxiv.org/abs/2301.12345, https://arxiv.org/pdf/2301.12345
+_ARXIV_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/([\w.]+)")
 
+# Shared client so repeated fetches (e.g. arXiv HTML then PDF) reuse the
+# pooled TCP/TLS connection instead of handshaking from scratch each time.
+_client: httpx.AsyncClient | None = None
 
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=60.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client. Call once the event loop is done fetching."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@functools.lru_cache(maxsize=1024)
 def _arxiv_id_from_url(url: str) -> str | None:
     """Extract arXiv paper ID from a URL."""
-    for pattern in (_ARXIV_ABS_RE, _ARXIV_PDF_RE):
-        match = pattern.search(url)
-        if match:
-            return match.group(1)
-    return None
+    match = _ARXIV_RE.search(url)
+    return match.group(1) if match else None
 
 
 def _arxiv_html_url(arxiv_id: str) -> str:
@@ -51,9 +74,11 @@ async def fetch_paper(
     Returns:
         A parsed Paper object.
     """
+    # Parsing is CPU-bound, so it runs in a worker thread to keep the event
+    # loop free for other requests and streams.
     path = Path(source)
     if path.exists():
-        return _parse_local(path)
+        return await asyncio.to_thread(_parse_local, path)
 
     return await _fetch_remote(source, prefer_html)
 
@@ -63,9 +88,9 @@ def _parse_local(path: Path) -> Paper:
     suffix = path.suffix.lower()
 
     if suffix == ".pdf":
-        paper = PdfParser().parse(path)
+        paper = pdf_parser.parse(path)
     elif suffix in (".html", ".htm"):
-        paper = HtmlParser().parse(path)
+        paper = html_parser.parse(path)
     else:
         raise ValueError(f"Unsupported file format: {suffix}")
 
@@ -75,37 +100,49 @@ def _parse_local(path: Path) -> Paper:
 async def _fetch_remote(url: str, prefer_html: bool) -> Paper:
     """Fetch and parse a remote paper."""
     arxiv_id = _arxiv_id_from_url(url)
+    client = _get_client()
+
+    if arxiv_id and prefer_html:
+        html_url = _arxiv_html_url(arxiv_id)
+        pdf_url = _arxiv_pdf_url(arxiv_id)
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=60.0) as client:
-        if arxiv_id and prefer_html:
+        # HEAD the PDF while the HTML request is in flight, so the fallback
+        # finds a warm connection instead of paying a second cold round-trip.
+        pdf_head = asyncio.create_task(client.head(pdf_url))
+        try:
             # Try arXiv HTML first — it parses much cleaner
-            html_url = _arxiv_html_url(arxiv_id)
             try:
                 resp = await client.get(html_url)
                 if resp.status_code == 200 and "text/html" in resp.headers.get("content-type", ""):
-                    paper = HtmlParser().parse_string(resp.text)
+                    paper = await asyncio.to_thread(html_parser.parse_string, resp.text)
                     paper.source_url = url
                     return paper
             except httpx.HTTPError:
                 pass  # Fall through to PDF
 
-            # Fall back to PDF
-            pdf_url = _arxiv_pdf_url(arxiv_id)
-            resp = await client.get(pdf_url)
-            resp.raise_for_status()
-            paper = PdfParser().parse_bytes(resp.content)
-            paper.source_url = url
-            return paper
+            with contextlib.suppress(httpx.HTTPError):
+                await pdf_head
+        finally:
+            pdf_head.cancel()
+            if pdf_head.done() and not pdf_head.cancelled():
+                pdf_head.exception()  # Mark a failed warm-up as handled
 
-        # Non-arXiv URL: guess format from content-type
-        resp = await client.get(url)
+        # Fall back to PDF
+        resp = await client.get(pdf_url)
         resp.raise_for_status()
-        content_type = resp.headers.get("content-type", "")
-
-        if "pdf" in content_type:
-            paper = PdfParser().parse_bytes(resp.content)
-        else:
-            paper = HtmlParser().parse_string(resp.text)
-
+        paper = await asyncio.to_thread(pdf_parser.parse_bytes, resp.content)
         paper.source_url = url
         return paper
+
+    # Non-arXiv URL: guess format from content-type
+    resp = await client.get(url)
+    resp.raise_for_status()
+    content_type = resp.headers.get("content-type", "")
+
+    if "pdf" in content_type:
+        paper = await asyncio.to_thread(pdf_parser.parse_bytes, resp.content)
+    else:
+        paper = await asyncio.to_thread(html_parser.parse_string, resp.text)
+
+    paper.source_url = url
+    return paper
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import importlib.util
+from collections import defaultdict
 from pathlib import Path
 
 from bs4 import BeautifulSoup, Tag
@@ -9,11 +11,41 @@ from bs4 import BeautifulSoup, Tag
 from millennialifier.models import Paper, Section
 
 
-# Tags that typically contain section headings
-_HEADING_TAGS = {"h1", "h2", "h3", "h4"}
+# Optional [html] extra
+_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
 
-# Sections to skip entirely
-_SKIP_HEADINGS = {"references", "bibliography", "acknowledgements", "acknowledgments"}
+# Tags that typically contain section headings
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4"})
+
+# Sections to skip entirely (compared against casefolded headings)
+_SKIP_HEADINGS = frozenset({"references", "bibliography", "acknowledgements", "acknowledgments"})
+
+# Every class any of the extractors looks up
+_TARGET_CLASSES = frozenset({
+    "ltx_title", "document-title", "title",
+    "ltx_personname",
+    "ltx_abstract", "abstract",
+    "ltx_section",
+})
+
+
+def _collect(soup: BeautifulSoup) -> dict[str, list[Tag]]:
+    """Gather every tag the extractors need in a single walk of the tree.
+
+    Keys are the class names in ``_TARGET_CLASSES``, plus ``"<title>"`` for
+    the document's <title> element and ``"<meta author>"`` for author meta
+    tags. Each list is in document order.
+    """
+    found: dict[str, list[Tag]] = defaultdict(list)
+    for tag in soup.find_all(True):
+        for cls in tag.get("class") or ():
+            if cls in _TARGET_CLASSES:
+                found[cls].append(tag)
+        if tag.name == "title":
+            found["<title>"].append(tag)
+        elif tag.name == "meta" and tag.get("name") == "author":
+            found["<meta author>"].append(tag)
+    return found
 
 
 class HtmlParser:
@@ -31,12 +63,13 @@ class HtmlParser:
 
     def parse_string(self, html: str) -> Paper:
         """Parse an HTML string into a Paper object."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _PARSER)
+        found = _collect(soup)
 
-        title = self._extract_title(soup)
-        authors = self._extract_authors(soup)
-        abstract = self._extract_abstract(soup)
-        sections = self._extract_sections(soup)
+        title = self._extract_title(found)
+        authors = self._extract_authors(found)
+        abstract = self._extract_abstract(found)
+        sections = self._extract_sections(soup, found)
 
         return Paper(
             title=title,
@@ -46,45 +79,44 @@ class HtmlParser:
             source_format="html",
         )
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, found: dict[str, list[Tag]]) -> str:
         """Pull the paper title."""
         # arXiv HTML uses <h1 class="ltx_title">
         for cls in ("ltx_title", "document-title", "title"):
-            tag = soup.find(class_=cls)
-            if tag:
-                return tag.get_text(strip=True)
+            if found[cls]:
+                return found[cls][0].get_text(strip=True)
 
         # Fallback to <title> tag
-        if soup.title:
-            return soup.title.get_text(strip=True)
+        if found["<title>"]:
+            return found["<title>"][0].get_text(strip=True)
 
         return "Untitled"
 
-    def _extract_authors(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_authors(self, found: dict[str, list[Tag]]) -> list[str]:
         """Pull author names."""
         authors: list[str] = []
 
         # arXiv HTML uses <span class="ltx_personname">
-        for tag in soup.find_all(class_="ltx_personname"):
+        for tag in found["ltx_personname"]:
             name = tag.get_text(strip=True)
             if name:
                 authors.append(name)
 
         if not authors:
             # Generic meta tag fallback
-            for meta in soup.find_all("meta", attrs={"name": "author"}):
+            for meta in found["<meta author>"]:
                 content = meta.get("content", "")
                 if content:
                     authors.append(content)
 
         return authors
 
-    def _extract_abstract(self, soup: BeautifulSoup) -> str:
+    def _extract_abstract(self, found: dict[str, list[Tag]]) -> str:
         """Pull the abstract text."""
         # arXiv HTML: <div class="ltx_abstract">
         for cls in ("ltx_abstract", "abstract"):
-            tag = soup.find(class_=cls)
-            if tag:
+            if found[cls]:
+                tag = found[cls][0]
                 # Remove the "Abstract" heading if present
                 heading = tag.find(class_="ltx_title")
                 if heading:
@@ -93,12 +125,12 @@ class HtmlParser:
 
         return ""
 
-    def _extract_sections(self, soup: BeautifulSoup) -> list[Section]:
+    def _extract_sections(self, soup: BeautifulSoup, found: dict[str, list[Tag]]) -> list[Section]:
         """Extract paper sections by finding headings and their content."""
         sections: list[Section] = []
 
         # arXiv HTML wraps sections in <section class="ltx_section">
-        ltx_sections = soup.find_all(class_="ltx_section")
+        ltx_sections = found["ltx_section"]
         if ltx_sections:
             return self._parse_ltx_sections(ltx_sections)
 
@@ -113,7 +145,7 @@ class HtmlParser:
             heading_tag = sec.find(class_="ltx_title")
             heading = heading_tag.get_text(strip=True) if heading_tag else "Untitled Section"
 
-            if heading.lower() in _SKIP_HEADINGS:
+            if heading.casefold() in _SKIP_HEADINGS:
                 continue
 
             # Remove the heading from the section content
@@ -130,6 +162,9 @@ class HtmlParser:
         """Fallback: walk the DOM looking for heading tags."""
         sections: list[Section] = []
         current_heading: str | None = None
+        skip_current = False
+        # Every stripped text node of the current section, joined once at the
+        # end rather than building and joining a string per element.
         current_parts: list[str] = []
 
         body = soup.find("body") or soup
@@ -140,20 +175,19 @@ class HtmlParser:
             if element.name in _HEADING_TAGS:
                 # Save previous section
                 if current_heading is not None:
-                    content = "\n".join(current_parts).strip()
-                    if content and current_heading.lower() not in _SKIP_HEADINGS:
+                    content = "\n".join(current_parts)
+                    if content and not skip_current:
                         sections.append(Section(heading=current_heading, content=content))
                 current_heading = element.get_text(strip=True)
+                skip_current = current_heading.casefold() in _SKIP_HEADINGS
                 current_parts = []
             elif current_heading is not None:
-                text = element.get_text(separator="\n", strip=True)
-                if text:
-                    current_parts.append(text)
+                current_parts.extend(element.stripped_strings)
 
         # Last section
         if current_heading is not None:
-            content = "\n".join(current_parts).strip()
-            if content and current_heading.lower() not in _SKIP_HEADINGS:
+            content = "\n".join(current_parts)
+            if content and not skip_current:
                 sections.append(Section(heading=current_heading, content=content))
 
         # If nothing found, grab all paragraph text as one section
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
 import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import pymupdf
@@ -31,7 +34,40 @@ _HEADING_PATTERNS = [
     r"^(\d+\.?\s+\S.{2,60})$",
 ]
 
-_HEADING_RE = [re.compile(p, re.IGNORECASE) for p in _HEADING_PATTERNS]
+# All patterns fused into one alternation, so each line costs a single match
+_HEADING_RE = re.compile(
+    "^(?:" + "|".join(f"(?:{p[1:-1]})" for p in _HEADING_PATTERNS) + ")$",
+    re.IGNORECASE,
+)
+
+# Lowercased first three letters of every named heading above; a line that
+# neither starts with one of these nor with a digit can't be a heading.
+_FIRST_WORDS = frozenset({
+    "abs", "int", "rel", "bac", "met", "app", "exp", "res",
+    "eva", "dis", "con", "fut", "ack", "ref",
+})
+
+_LEAD_NUM_RE = re.compile(r"^\d+(?:\.\d+)*\.?\s*")
+
+# PyMuPDF's default plain-text flags, plus re-joining words hyphenated across lines
+_TEXT_FLAGS = pymupdf.TEXTFLAGS_TEXT | pymupdf.TEXT_DEHYPHENATE
+
+# A line of text with the font metrics used to spot headings:
+# (text, font size, whether every span in it is bold)
+_FontLine = tuple[str, float, bool]
+
+# Lines at least this much larger than body text count as headings
+_HEADING_SIZE_RATIO = 1.15
+
+# Fewer font-based heading candidates than this means the PDF doesn't use
+# font styling for headings, and the regex-based splitter is used instead
+_MIN_FONT_HEADINGS = 2
+
+# Pages used to work out the body text size
+_BODY_SAMPLE_PAGES = 5
+
+# Lines a title can wrap onto; past that, same-size text is body text
+_MAX_TITLE_LINES = 4
 
 
 def _is_heading(line: str) -> bool:
@@ -39,17 +75,56 @@ def _is_heading(line: str) -> bool:
     stripped = line.strip()
     if not stripped or len(stripped) > 80:
         return False
-    return any(r.match(stripped) for r in _HEADING_RE)
+    if not (stripped[0].isdigit() or stripped[:3].lower() in _FIRST_WORDS):
+        return False
+    return _HEADING_RE.match(stripped) is not None
+
+
+def _is_text_section(line: str) -> bool:
+    """Check if ``_structure_text`` would start a section (not the abstract) at a line."""
+    return _is_heading(line) and _clean_heading(line).casefold() != "abstract"
 
 
 def _clean_heading(line: str) -> str:
     """Normalize a heading string."""
     stripped = line.strip()
     # Remove leading numbers like "1." or "2.1"
-    cleaned = re.sub(r"^\d+(?:\.\d+)*\.?\s*", "", stripped)
+    cleaned = _LEAD_NUM_RE.sub("", stripped)
     return cleaned.title() if cleaned else stripped
 
 
+def _iter_lines(doc: pymupdf.Document) -> Iterator[str]:
+    """Yield text lines page by page, never holding the whole document's text."""
+    for page in doc:
+        yield from page.get_text("text", flags=_TEXT_FLAGS).split("\n")
+
+
+def _font_lines(page: pymupdf.Page) -> list[_FontLine]:
+    """Extract a page's non-empty lines along with their font size and weight."""
+    lines: list[_FontLine] = []
+    for block in page.get_text("dict", flags=_TEXT_FLAGS)["blocks"]:
+        for line in block.get("lines", ()):
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            text = "".join(span["text"] for span in line["spans"]).strip()
+            size = round(max(span["size"] for span in spans), 1)
+            bold = all(span["flags"] & pymupdf.TEXT_FONT_BOLD for span in spans)
+            lines.append((text, size, bold))
+    return lines
+
+
+def _join_lines(lines: list[str]) -> str:
+    """Join body lines, re-joining words hyphenated across a line break."""
+    out: list[str] = []
+    for line in lines:
+        if out and out[-1].endswith("-") and line[:1].islower():
+            out[-1] = out[-1][:-1] + line
+        else:
+            out.append(line)
+    return "\n".join(out)
+
+
 class PdfParser:
     """Extract structured sections from a research paper PDF."""
 
@@ -59,30 +134,170 @@ class PdfParser:
         Args:
             source: Path to a PDF file.
         """
-        path = Path(source)
-        doc = pymupdf.open(str(path))
-
-        # Extract full text page by page
-        full_text = ""
-        for page in doc:
-            full_text += page.get_text() + "\n"
-        doc.close()
-
-        return self._structure_text(full_text, source_format="pdf")
+        with pymupdf.open(str(Path(source))) as doc:
+            return self._parse_doc(doc)
 
     def parse_bytes(self, data: bytes) -> Paper:
         """Parse PDF bytes into a Paper object."""
-        doc = pymupdf.open(stream=data, filetype="pdf")
-        full_text = ""
-        for page in doc:
-            full_text += page.get_text() + "\n"
-        doc.close()
+        with pymupdf.open(stream=data, filetype="pdf") as doc:
+            return self._parse_doc(doc)
+
+    def _parse_doc(self, doc: pymupdf.Document) -> Paper:
+        """Split by font styling when the PDF has it, else by heading patterns."""
+        pages = (_font_lines(page) for page in doc)
+        paper = self._structure_fonts(pages, source_format="pdf")
+        if paper is not None:
+            return paper
+        return self._structure_text(_iter_lines(doc), source_format="pdf")
+
+    def _structure_fonts(
+        self, pages: Iterable[list[_FontLine]], source_format: str
+    ) -> Paper | None:
+        """Split font-annotated pages into sections, using size and weight.
+
+        Headings are lines noticeably larger than the body text, or set
+        entirely in bold. Returns None when the PDF doesn't mark its headings
+        that way, or when splitting by heading patterns would find more
+        sections, so the caller can fall back to ``_structure_text``.
+        """
+        pages = iter(pages)
+
+        # Body text is whatever size carries the most characters; the first
+        # few pages are enough to tell, so the rest can stream through
+        sample = list(itertools.islice(pages, _BODY_SAMPLE_PAGES))
+        first = next((n for n, page in enumerate(sample) if page), None)
+        if first is None:
+            return None
+        first_page = sample[first]
+        weights: Counter[float] = Counter()
+        for page in sample:
+            for text, size, _ in page:
+                weights[size] += len(text)
+        body_size = weights.most_common(1)[0][0]
+        threshold = body_size * _HEADING_SIZE_RATIO
+
+        # Title: the first run of the largest text on the first page, when
+        # that's larger than the body text; otherwise the first line
+        title_size = max(size for _, size, _ in first_page)
+        if title_size > body_size:
+            title_start = next(i for i, (_, size, _) in enumerate(first_page) if size == title_size)
+            title_end = title_start
+            while (
+                title_end < len(first_page)
+                and title_end - title_start < _MAX_TITLE_LINES
+                and first_page[title_end][1] == title_size
+            ):
+                title_end += 1
+        else:
+            title_start, title_end = 0, 1
+        title = " ".join(text for text, _, _ in first_page[title_start:title_end])
+
+        lines = itertools.chain(
+            first_page[title_end:],
+            itertools.chain.from_iterable(sample[first + 1:]),
+            itertools.chain.from_iterable(pages),
+        )
+        first_page_left = len(first_page) - title_end
+
+        abstract = ""
+        sections: list[Section] = []
+        current_heading: str | None = None
+        current_lines: list[str] = []
+        headings = 0
+        recognized = False
+        # Sections the heading patterns would find, counting the title too
+        # since _structure_text checks it like any other line
+        text_sections = sum(
+            1 for text, _, _ in first_page[:title_end] if _is_text_section(text)
+        )
+
+        def close_section() -> None:
+            nonlocal abstract
+            heading = _clean_heading(current_heading)
+            body = _join_lines(current_lines).strip()
+            if not body and not _is_heading(current_heading):
+                # A styled line with nothing under it ("Table 1: Results")
+                # is text, not a section; keep it with the one before
+                if sections:
+                    sections[-1].content += "\n" + current_heading
+            elif heading.casefold() == "abstract":
+                abstract = body
+            else:
+                sections.append(Section(heading=heading, content=body))
+
+        prev_size = 0.0
+        for line, following in itertools.pairwise(itertools.chain(lines, [None])):
+            text, size, bold = line
+            first_page_left -= 1
+            if _is_text_section(text):
+                text_sections += 1
+
+            is_heading = (
+                len(text) <= 80
+                and (
+                    size >= threshold
+                    # Body-size bold text is only a heading when it isn't a
+                    # sentence ("Definition 1. A thing is a thing.") and plain
+                    # text follows it (so bold paragraphs and captions before
+                    # a heading don't count)
+                    or (
+                        bold
+                        and not text.endswith(".")
+                        and following is not None
+                        and not following[2]
+                    )
+                )
+                and any(c.isalpha() for c in text)
+            )
+            if not is_heading:
+                if current_heading is not None:
+                    current_lines.append(text)
+            # A heading wrapped onto a second line continues the first,
+            # unless that line is a heading of its own ("2.1 Setup")
+            elif (
+                current_heading is not None
+                and not current_lines
+                and prev_size == size
+                and not _LEAD_NUM_RE.match(text)
+                and not _is_heading(text)
+            ):
+                current_heading += " " + text
+            else:
+                if _is_heading(text):
+                    if not recognized and first_page_left >= 0:
+                        # Author names and affiliations are often styled like
+                        # headings too; when a recognizable heading ("Abstract",
+                        # "1 Introduction") is on the first page, everything
+                        # above it is front matter
+                        sections.clear()
+                        current_heading = None
+                        headings = 0
+                    recognized = True
+                if current_heading is not None:
+                    close_section()
+                current_heading = text
+                current_lines = []
+                headings += 1
+            prev_size = size
+        if current_heading is not None:
+            close_section()
 
-        return self._structure_text(full_text, source_format="pdf")
+        if headings < _MIN_FONT_HEADINGS:
+            return None
+        if not recognized and len(sections) < text_sections:
+            return None
 
-    def _structure_text(self, text: str, source_format: str) -> Paper:
-        """Split raw text into structured sections."""
-        lines = text.split("\n")
+        return Paper(
+            title=title,
+            authors=[],
+            abstract=abstract,
+            sections=sections,
+            source_format=source_format,
+        )
+
+    def _structure_text(self, lines: Iterable[str], source_format: str) -> Paper:
+        """Split a stream of text lines into structured sections, in one pass."""
+        lines = iter(lines)
 
         title = ""
         authors: list[str] = []
@@ -91,10 +306,15 @@ class PdfParser:
         current_heading: str | None = None
         current_lines: list[str] = []
 
-        # First non-empty line is likely the title
+        # Lines before the first heading, kept only for the no-sections fallback
+        preamble: list[str] = []
+
+        # First non-empty line is likely the title; it still goes through the
+        # heading check below, so put it back in front of the stream.
         for line in lines:
             if line.strip():
                 title = line.strip()
+                lines = itertools.chain((line,), lines)
                 break
 
         in_body = False
@@ -103,7 +323,7 @@ class PdfParser:
                 # Save previous section
                 if current_heading is not None:
                     body = "\n".join(current_lines).strip()
-                    if current_heading.lower() == "abstract":
+                    if current_heading.casefold() == "abstract":
                         abstract = body
                     else:
                         sections.append(Section(heading=current_heading, content=body))
@@ -113,18 +333,20 @@ class PdfParser:
                 in_body = True
             elif in_body:
                 current_lines.append(line)
+            else:
+                preamble.append(line)
 
         # Don't forget the last section
         if current_heading is not None:
             body = "\n".join(current_lines).strip()
-            if current_heading.lower() == "abstract":
+            if current_heading.casefold() == "abstract":
                 abstract = body
             else:
                 sections.append(Section(heading=current_heading, content=body))
 
         # If no sections found, treat the whole text as one section
         if not sections and not abstract:
-            sections.append(Section(heading="Full Paper", content=text.strip()))
+            sections.append(Section(heading="Full Paper", content="\n".join(preamble).strip()))
 
         return Paper(
             title=title,
@@ -1,5 +1,7 @@
 """System prompts for the millennial translator, scaled by tone level."""
 
+from functools import lru_cache
+
 from millennialifier.models import ToneLevel
 
 _BASE_INSTRUCTIONS = """\
@@ -58,15 +60,77 @@ Tone: Full unhinged millennial chaos. Think "chaotic group chat energy from some
 }
 
 
+# Static instructions that open each user message. Only the section text
+# follows them, so every request shares one prefix with the last — which is
+# what provider-side prompt caching keys on.
+_SECTION_INSTRUCTIONS = "Translate this paper section into millennial speak.\n\n"
+
+_BATCH_INSTRUCTIONS = (
+    "Translate each of the following paper sections into millennial speak.\n"
+    'Return ONLY a JSON array with one {"heading": ..., "translated": ...} '
+    "object per section, in the same order as given.\n"
+)
+
+_TAGGED_BATCH_INSTRUCTIONS = (
+    "Translate each of the following paper sections into millennial speak.\n"
+    'Wrap each translation in the same <SECTION i="N">...</SECTION> tags as '
+    "its source, in the same order, with nothing outside the tags.\n"
+)
+
+
+@lru_cache(maxsize=len(ToneLevel))
 def build_system_prompt(tone: ToneLevel) -> str:
-    """Build the full system prompt for a given tone level."""
+    """Build the full system prompt for a given tone level.
+
+    Cached per tone, so every section of a paper shares one identical prompt
+    string — which also keeps the prefix stable for provider-side caching.
+    """
     return _BASE_INSTRUCTIONS + "\n" + _TONE_INSTRUCTIONS[tone]
 
 
 def build_section_prompt(heading: str, content: str) -> str:
     """Build the user message for translating a single section."""
-    return (
-        f"Translate this paper section into millennial speak.\n\n"
-        f"## Section: {heading}\n\n"
-        f"{content}"
-    )
+    return f"{_SECTION_INSTRUCTIONS}## Section: {heading}\n\n{content}"
+
+
+def build_batch_prompt(headings: list[str], contents: list[str]) -> str:
+    """Build one user message that translates several sections.
+
+    ``headings`` and ``contents`` are parallel lists, one entry per section.
+
+    The model is asked for a JSON array so the replies can be split back
+    into per-section translations.
+    """
+    parts = [_BATCH_INSTRUCTIONS]
+    for heading, content in zip(headings, contents):
+        parts.append(f"## Section: {heading}\n\n{content}\n")
+    return "\n".join(parts)
+
+
+def build_tagged_batch_prompt(headings: list[str], contents: list[str]) -> str:
+    """Build one user message that translates several sections as a stream.
+
+    Sections are wrapped in numbered ``<SECTION i="N">`` tags, and the model
+    is asked to tag its translations the same way, so a streamed reply can
+    be split back into sections while it is still arriving.
+    """
+    parts = [_TAGGED_BATCH_INSTRUCTIONS]
+    for i, (heading, content) in enumerate(zip(headings, contents), start=1):
+        parts.append(f'<SECTION i="{i}">\n## Section: {heading}\n\n{content}\n</SECTION>\n')
+    return "\n".join(parts)
+
+
+@lru_cache(maxsize=len(ToneLevel))
+def prompt_signature(tone: ToneLevel) -> str:
+    """Every prompt used for a tone, with placeholders for the section text.
+
+    Changes whenever any instruction wording does, so cached translations
+    made with an older prompt aren't reused.
+    """
+    heading, content = "{heading}", "{content}"
+    return "\0".join((
+        build_system_prompt(tone),
+        build_section_prompt(heading, content),
+        build_batch_prompt([heading], [content]),
+        build_tagged_batch_prompt([heading], [content]),
+    ))
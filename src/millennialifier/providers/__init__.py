@@ -5,6 +5,8 @@ Providers are loaded lazily — only the SDK you actually use needs to be instal
 
 from __future__ import annotations
 
+import importlib
+import os
 from dataclasses import dataclass
 
 from millennialifier.providers.base import LLMProvider, Message
@@ -13,6 +15,7 @@ __all__ = [
     "LLMProvider",
     "Message",
     "get_provider",
+    "close_providers",
     "check_provider_configured",
     "list_providers",
     "PROVIDER_INFO",
@@ -28,6 +31,11 @@ class ProviderInfo:
     default_model: str
     free: bool
     api_key_env: str | list[str] | None  # None means no key needed
+    rate_limit_rpm: int | None = None  # None means no client-side throttling
+    max_concurrency: int | None = None  # Requests in flight at once; None means the app default
+    provider_class: str = ""  # "module:Class" implementing it, imported on first use
+    sdk_module: str | None = None  # The SDK it needs; None means nothing extra
+    extra: str | None = None  # pip extra that installs the SDK
 
 
 PROVIDER_INFO: dict[str, ProviderInfo] = {
@@ -37,10 +45,23 @@ PROVIDER_INFO: dict[str, ProviderInfo] = {
         default_model="gemini-2.0-flash",
         free=True,
         api_key_env=["GOOGLE_API_KEY", "GEMINI_API_KEY"],
+        rate_limit_rpm=15,
+        max_concurrency=4,
+        provider_class="millennialifier.providers.google:GeminiProvider",
+        sdk_module="google.genai",
+        extra="gemini",
     ),
 }
 
 
+# API key variables per provider, normalized to tuples once at import
+_ENV_VARS: dict[str, tuple[str, ...]] = {
+    name: tuple(info.api_key_env) if isinstance(info.api_key_env, list) else (info.api_key_env,)
+    for name, info in PROVIDER_INFO.items()
+    if info.api_key_env is not None
+}
+
+
 class ProviderNotConfiguredError(Exception):
     """Raised when a provider's API key is not set."""
 
@@ -56,11 +77,9 @@ def check_provider_configured(name: str) -> None:
         raise ValueError(
             f"Unknown provider '{name}'. Available: {', '.join(PROVIDER_INFO.keys())}"
         )
-    if info.api_key_env is None:
+    env_vars = _ENV_VARS.get(name)
+    if env_vars is None:
         return  # Ollama — no key needed
-    import os
-
-    env_vars = info.api_key_env if isinstance(info.api_key_env, list) else [info.api_key_env]
     if not any(os.environ.get(var) for var in env_vars):
         names = " or ".join(env_vars)
         raise ProviderNotConfiguredError(
@@ -69,26 +88,43 @@ def check_provider_configured(name: str) -> None:
         )
 
 
+def _load(info: ProviderInfo) -> LLMProvider:
+    """Import a provider's module on first use and instantiate its class."""
+    module, _, cls_name = info.provider_class.partition(":")
+    try:
+        cls = getattr(importlib.import_module(module), cls_name)
+        return cls()
+    except ImportError:
+        raise ImportError(
+            f"{info.description} SDK ({info.sdk_module}) not installed. "
+            f"Run: pip install paper-millennialifier[{info.extra}]"
+        )
+
+
+# One instance per provider, so its SDK client and connection pool are reused
+_instances: dict[str, LLMProvider] = {}
+
+
 def get_provider(name: str = "gemini") -> LLMProvider:
-    """Instantiate the Gemini provider.
+    """Return the shared instance of a provider, creating it on first use.
 
     Raises ``ProviderNotConfiguredError`` if the required API key isn't set,
     or ``ImportError`` if the required SDK isn't installed.
     """
     check_provider_configured(name)
 
-    if name == "gemini":
-        try:
-            from millennialifier.providers.google import GeminiProvider
-            return GeminiProvider()
-        except ImportError:
-            raise ImportError(
-                "Google GenAI SDK not installed. Run: pip install paper-millennialifier[gemini]"
-            )
-
-    raise ValueError(
-        f"Unknown provider '{name}'. Only 'gemini' is supported."
-    )
+    llm = _instances.get(name)
+    if llm is None:
+        llm = _instances[name] = _load(PROVIDER_INFO[name])
+    return llm
+
+
+async def close_providers() -> None:
+    """Close every shared provider; the next ``get_provider`` builds a fresh one."""
+    instances = list(_instances.values())
+    _instances.clear()
+    for llm in instances:
+        await llm.aclose()
 
 
 def list_providers() -> list[ProviderInfo]:
@@ -26,8 +26,12 @@ class LLMProvider(ABC):
         messages: list[Message],
         model: str | None = None,
         max_tokens: int = 4096,
+        json_output: bool = False,
     ) -> str:
-        """Send a prompt and return the full response text."""
+        """Send a prompt and return the full response text.
+
+        If ``json_output`` is True, ask the provider to constrain the reply to JSON.
+        """
 
     @abstractmethod
     async def stream(
@@ -39,6 +43,24 @@ class LLMProvider(ABC):
     ) -> AsyncIterator[str]:
         """Send a prompt and yield response text chunks as they arrive."""
 
+    async def batch_complete(
+        self,
+        system: str,
+        requests: list[list[Message]],
+        model: str | None = None,
+        max_tokens: int = 4096,
+    ) -> list[str]:
+        """Submit many prompts as one provider batch job and wait for the results.
+
+        Batch jobs are cheaper and have looser rate limits than live calls, but
+        may take a long time to finish. Returns one response text per request,
+        in submission order.
+        """
+        raise NotImplementedError(f"Provider '{self.name}' does not support batch jobs.")
+
+    async def aclose(self) -> None:
+        """Release the provider's HTTP resources. Safe to call more than once."""
+
     def get_model(self, model: str | None) -> str:
         """Return the requested model or the provider's default."""
         return model or self.default_model
@@ -2,20 +2,69 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import AsyncIterator
+from functools import lru_cache
+
+import httpx
+from google import genai
+from google.genai import types
 
 from millennialifier.providers.base import LLMProvider, Message
 
+# Batch job states after which polling stops
+_BATCH_FINAL_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+}
+
+# Pool for the concurrent section requests; with HTTP/2 they multiplex over
+# a single TLS connection instead of each opening their own.
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+
+@lru_cache(maxsize=32)
+def _make_config(
+    system: str,
+    max_tokens: int,
+    json_output: bool = False,
+) -> types.GenerateContentConfig:
+    """Build (once per distinct prompt/settings) the request config.
+
+    Every section of a paper shares the same system prompt, so this is
+    built once per translation run instead of once per request.
+    """
+    return types.GenerateContentConfig(
+        system_instruction=system,
+        max_output_tokens=max_tokens,
+        response_mime_type="application/json" if json_output else None,
+    )
+
+
+def _to_contents(messages: list[Message]) -> str | list[types.Content]:
+    """Convert messages to Gemini contents.
+
+    A lone user message (the translation hot path) is passed as a plain
+    string, which the SDK accepts without building a Content/Part graph.
+    """
+    if len(messages) == 1 and messages[0].role == "user":
+        return messages[0].content
+    return [types.Content(role=m.role, parts=[types.Part(text=m.content)]) for m in messages]
+
 
 class GeminiProvider(LLMProvider):
     name = "gemini"
     default_model = "gemini-2.0-flash"
 
     def __init__(self) -> None:
-        from google import genai
-
-        self._client = genai.Client()
+        self._http = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+        self._client = genai.Client(
+            http_options=types.HttpOptions(httpx_async_client=self._http),
+        )
 
     async def complete(
         self,
@@ -23,18 +72,12 @@ class GeminiProvider(LLMProvider):
         messages: list[Message],
         model: str | None = None,
         max_tokens: int = 4096,
+        json_output: bool = False,
     ) -> str:
-        from google.genai import types
-
-        contents = [types.Content(role=m.role, parts=[types.Part(text=m.content)]) for m in messages]
-
         response = await self._client.aio.models.generate_content(
             model=self.get_model(model),
-            contents=contents,
-            config=types.GenerateContentConfig(
-                system_instruction=system,
-                max_output_tokens=max_tokens,
-            ),
+            contents=_to_contents(messages),
+            config=_make_config(system, max_tokens, json_output),
         )
         return response.text
 
@@ -45,21 +88,50 @@ class GeminiProvider(LLMProvider):
         model: str | None = None,
         max_tokens: int = 4096,
     ) -> AsyncIterator[str]:
-        from google.genai import types
-
-        contents = [types.Content(role=m.role, parts=[types.Part(text=m.content)]) for m in messages]
-
         async for chunk in await self._client.aio.models.generate_content_stream(
             model=self.get_model(model),
-            contents=contents,
-            config=types.GenerateContentConfig(
-                system_instruction=system,
-                max_output_tokens=max_tokens,
-            ),
+            contents=_to_contents(messages),
+            config=_make_config(system, max_tokens),
         ):
             if chunk.text:
                 yield chunk.text
 
+    async def batch_complete(
+        self,
+        system: str,
+        requests: list[list[Message]],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        poll_interval: float = 30.0,
+    ) -> list[str]:
+        config = _make_config(system, max_tokens)
+        job = await self._client.aio.batches.create(
+            model=self.get_model(model),
+            src=[
+                types.InlinedRequest(contents=_to_contents(messages), config=config)
+                for messages in requests
+            ],
+            config=types.CreateBatchJobConfig(display_name="millennialifier"),
+        )
+
+        while job.state not in _BATCH_FINAL_STATES:
+            await asyncio.sleep(poll_interval)
+            job = await self._client.aio.batches.get(name=job.name)
+
+        if job.state != types.JobState.JOB_STATE_SUCCEEDED:
+            raise RuntimeError(f"Gemini batch job {job.name} ended as {job.state.name}.")
+
+        results: list[str] = []
+        for item in job.dest.inlined_responses:
+            if item.error or item.response is None:
+                raise RuntimeError(f"Gemini batch job {job.name} returned an error: {item.error}")
+            results.append(item.response.text or "")
+        return results
+
+    async def aclose(self) -> None:
+        await self._client.aio.aclose()
+        await self._http.aclose()  # The SDK leaves clients it was handed open
+
     @staticmethod
     def is_configured() -> bool:
         return bool(os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY"))
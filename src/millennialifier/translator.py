@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
 from collections.abc import AsyncIterator
 
+from millennialifier import cache
+from millennialifier.concurrency import DEFAULT_MAX_CONCURRENCY, AsyncLeakyBucket
 from millennialifier.models import Paper, Section, ToneLevel
-from millennialifier.prompts import build_section_prompt, build_system_prompt
-from millennialifier.providers import LLMProvider, Message, get_provider
+from millennialifier.prompts import (
+    build_batch_prompt,
+    build_section_prompt,
+    build_system_prompt,
+    build_tagged_batch_prompt,
+    prompt_signature,
+)
+from millennialifier.providers import PROVIDER_INFO, LLMProvider, Message, get_provider
 
 
 DEFAULT_PROVIDER = "gemini"
+DEFAULT_BATCH_BUDGET = 3000  # Approximate input tokens per packed request
+
+# Input tokens per streamed group. Lower than the JSON budget, so the whole
+# tagged reply fits well inside the provider's output limit and the last
+# section isn't cut off
+DEFAULT_STREAM_BATCH_BUDGET = 1500
+
+# Sections not worth an LLM call — they're passed through untranslated
+_MIN_WORDS = 15
+_PASSTHROUGH_HEADINGS = frozenset({"references", "bibliography", "acknowledgments", "acknowledgements"})
+
+# Delimiters the model wraps around each section of a tagged batch reply
+_SECTION_OPEN_RE = re.compile(r'<SECTION i="(\d+)">')
+_SECTION_CLOSE = "</SECTION>"
 
 
 def _resolve_provider(
@@ -22,12 +47,53 @@ def _resolve_provider(
     return get_provider(provider_name or DEFAULT_PROVIDER)
 
 
+def concurrency_for(provider_name: str, max_concurrency: int | None = None) -> int:
+    """Resolve a concurrency cap, falling back to the provider's recommended one."""
+    if max_concurrency is None:
+        info = PROVIDER_INFO.get(provider_name)
+        max_concurrency = (info.max_concurrency if info else None) or DEFAULT_MAX_CONCURRENCY
+    return max(1, max_concurrency)
+
+
+def rate_limiter_for(provider_name: str, rpm: int | None = None) -> AsyncLeakyBucket | None:
+    """Build a limiter for the given RPM, falling back to the provider's default."""
+    if rpm is None:
+        info = PROVIDER_INFO.get(provider_name)
+        rpm = info.rate_limit_rpm if info else None
+    return AsyncLeakyBucket(rpm) if rpm else None
+
+
+def needs_translation(section: Section) -> bool:
+    """Whether a section is worth sending to the LLM.
+
+    PDF parsing produces degenerate "sections" (page headers, captions,
+    reference lists); these are kept as-is instead of costing a round-trip.
+    """
+    if section.heading.casefold() in _PASSTHROUGH_HEADINGS:
+        return False
+    return len(section.content.split()) >= _MIN_WORDS
+
+
+def _cache_key(section: Section, tone: ToneLevel, model: str | None, llm: LLMProvider) -> str:
+    """Cache key for a section translated with these settings."""
+    return cache.make_key(
+        section.heading,
+        section.content,
+        tone,
+        llm.get_model(model),
+        llm.name,
+        prompt_signature(tone),
+    )
+
+
 async def translate_section(
     section: Section,
     tone: ToneLevel = ToneLevel.BALANCED,
     model: str | None = None,
     provider: LLMProvider | None = None,
     provider_name: str | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
 ) -> str:
     """Translate a single paper section.
 
@@ -37,19 +103,30 @@ async def translate_section(
         model: Model ID override (uses provider default if None).
         provider: A pre-configured LLMProvider instance.
         provider_name: Provider name to instantiate (ignored if provider given).
+        use_cache: Reuse and store translations in the on-disk cache.
+        refresh_cache: Skip cache lookups but still store the fresh result.
 
     Returns:
         The translated section text.
     """
     llm = _resolve_provider(provider, provider_name)
+    key = _cache_key(section, tone, model, llm) if use_cache else None
+    if key and not refresh_cache:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
     system_prompt = build_system_prompt(tone)
     user_prompt = build_section_prompt(section.heading, section.content)
 
-    return await llm.complete(
+    translated = await llm.complete(
         system=system_prompt,
         messages=[Message(role="user", content=user_prompt)],
         model=model,
     )
+    if key:
+        cache.put(key, translated)
+    return translated
 
 
 async def translate_section_stream(
@@ -58,21 +135,413 @@ async def translate_section_stream(
     model: str | None = None,
     provider: LLMProvider | None = None,
     provider_name: str | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
 ) -> AsyncIterator[str]:
     """Translate a single section with streaming output.
 
-    Yields text chunks as they arrive.
+    Yields text chunks as they arrive. A cached translation comes back as a
+    single chunk; a fresh one is stored once the stream finishes.
     """
     llm = _resolve_provider(provider, provider_name)
+    key = _cache_key(section, tone, model, llm) if use_cache else None
+    if key and not refresh_cache:
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
     system_prompt = build_system_prompt(tone)
     user_prompt = build_section_prompt(section.heading, section.content)
 
+    parts: list[str] = []
     async for chunk in llm.stream(
         system=system_prompt,
         messages=[Message(role="user", content=user_prompt)],
         model=model,
     ):
+        parts.append(chunk)
         yield chunk
+    if key:
+        cache.put(key, "".join(parts))
+
+
+class _SectionSplitter:
+    """Split a streamed tagged-batch reply into per-section chunks.
+
+    Text is fed in as it arrives; ``feed`` returns ``(index, text)`` pairs
+    for whatever can already be attributed to a section. Partial tags at the
+    end of a chunk are held back until the next one completes them.
+    """
+
+    def __init__(self, count: int) -> None:
+        self._count = count
+        self._buf = ""
+        self._current: int | None = None  # Section being read, -1 if ignored
+        self._last = -1  # Sections must arrive in order
+        self._at_start = False
+        self.cut_off: int | None = None  # Section the reply ended inside of, if any
+
+    def feed(self, text: str) -> list[tuple[int, str]]:
+        self._buf += text
+        out: list[tuple[int, str]] = []
+
+        while True:
+            if self._current is None:
+                match = _SECTION_OPEN_RE.search(self._buf)
+                if match is None:
+                    # Keep only a possible partial opening tag
+                    cut = self._buf.rfind("<")
+                    self._buf = self._buf[cut:] if cut != -1 else ""
+                    return out
+                index = int(match.group(1)) - 1
+                valid = self._last < index < self._count
+                self._current = index if valid else -1
+                if valid:
+                    self._last = index
+                self._at_start = True
+                self._buf = self._buf[match.end():]
+                continue
+
+            end = self._buf.find(_SECTION_CLOSE)
+            if end != -1:
+                self._emit(out, self._buf[:end].rstrip())
+                self._buf = self._buf[end + len(_SECTION_CLOSE):]
+                self._current = None
+                continue
+
+            # Hold back a possible partial closing tag and trailing whitespace
+            # (dropped if the section ends right after it)
+            cut = self._buf.rfind("<")
+            if cut == -1 or not _SECTION_CLOSE.startswith(self._buf[cut:]):
+                cut = len(self._buf)
+            body = self._buf[:cut].rstrip()
+            self._emit(out, body)
+            self._buf = self._buf[len(body):]
+            return out
+
+    def close(self) -> list[tuple[int, str]]:
+        """Flush a final section the model left unterminated.
+
+        Its index is kept in ``cut_off``: the reply was probably truncated,
+        so the text may be incomplete.
+        """
+        out: list[tuple[int, str]] = []
+        if self._current is not None:
+            if self._current >= 0:
+                self.cut_off = self._current
+            self._emit(out, self._buf.rstrip())
+        self._buf = ""
+        return out
+
+    def _emit(self, out: list[tuple[int, str]], text: str) -> None:
+        if self._at_start:
+            text = text.lstrip("\n")
+        if text and self._current is not None and self._current >= 0:
+            out.append((self._current, text))
+            self._at_start = False
+
+
+async def translate_sections_stream(
+    sections: list[Section],
+    tone: ToneLevel = ToneLevel.BALANCED,
+    model: str | None = None,
+    provider: LLMProvider | None = None,
+    provider_name: str | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    bucket: AsyncLeakyBucket | None = None,
+) -> AsyncIterator[tuple[int, str]]:
+    """Translate several sections in one streaming request.
+
+    Yields ``(index, chunk)`` pairs, where ``index`` points into ``sections``.
+    Sections come out strictly in order and each one's chunks are
+    contiguous, so a section is complete once a chunk for the next one
+    arrives (or the stream ends). A section the model returned no text for
+    (say, a blocked response) still gets one empty chunk. Cached sections come back as a single
+    chunk at their position; only the rest are requested, and each is
+    stored in the cache as soon as it completes, unless the reply was cut
+    off inside it. ``bucket`` is waited on before every request that
+    actually goes out.
+    """
+    llm = _resolve_provider(provider, provider_name)
+    keys = [_cache_key(s, tone, model, llm) for s in sections] if use_cache else []
+    results: list[str | None] = [None] * len(sections)
+    if keys and not refresh_cache:
+        results = [cache.get(key) for key in keys]
+    todo = [i for i, text in enumerate(results) if text is None]
+    if todo and bucket:
+        await bucket.acquire()
+
+    covered = 0  # Sections before this index are finished
+    current: int | None = None
+    parts: list[str] = []
+    cut_off: set[int] = set()  # Positions in todo whose text may be incomplete
+
+    def finish() -> None:
+        if keys and current is not None and todo.index(current) not in cut_off:
+            cache.put(keys[current], "".join(parts))
+
+    async for j, text in _stream_group(
+        [sections[i] for i in todo], tone, model, llm, bucket, cut_off
+    ):
+        i = todo[j]
+        if i != current:
+            finish()
+            current, parts = i, []
+            for k in range(covered, i):
+                yield k, _or_empty(results[k])
+            covered = i + 1
+        parts.append(text)
+        yield i, text
+    finish()
+
+    for k in range(covered, len(sections)):
+        yield k, _or_empty(results[k])
+
+
+def _or_empty(text: str | None) -> str:
+    """A cached translation, or "" for a requested section that got no text back."""
+    return text if text is not None else ""
+
+
+async def _stream_group(
+    sections: list[Section],
+    tone: ToneLevel,
+    model: str | None,
+    llm: LLMProvider,
+    bucket: AsyncLeakyBucket | None = None,
+    cut_off: set[int] | None = None,
+) -> AsyncIterator[tuple[int, str]]:
+    """Stream a group of sections as one tagged request, bypassing the cache.
+
+    A section the model skipped is translated on its own request at the
+    point where it belongs, so the output keeps the order described in
+    ``translate_sections_stream``. Each of those waits on ``bucket``; the
+    caller has already waited for the first request. A section the reply
+    ended inside of is added to ``cut_off``.
+    """
+    if not sections:
+        return
+
+    if len(sections) == 1:
+        async for chunk in translate_section_stream(sections[0], tone, model, llm, use_cache=False):
+            yield 0, chunk
+        return
+
+    splitter = _SectionSplitter(len(sections))
+
+    async def tagged() -> AsyncIterator[tuple[int, str]]:
+        async for chunk in llm.stream(
+            system=build_system_prompt(tone),
+            messages=[
+                Message(
+                    role="user",
+                    content=build_tagged_batch_prompt(
+                        [s.heading for s in sections], [s.content for s in sections]
+                    ),
+                )
+            ],
+            model=model,
+        ):
+            for item in splitter.feed(chunk):
+                yield item
+        for item in splitter.close():
+            yield item
+
+    async def fallback(index: int) -> AsyncIterator[tuple[int, str]]:
+        if bucket:
+            await bucket.acquire()
+        async for chunk in translate_section_stream(
+            sections[index], tone, model, llm, use_cache=False
+        ):
+            yield index, chunk
+
+    covered = 0
+    async for i, text in tagged():
+        for skipped in range(covered, i):
+            async for item in fallback(skipped):
+                yield item
+        covered = i + 1
+        yield i, text
+
+    if cut_off is not None and splitter.cut_off is not None:
+        cut_off.add(splitter.cut_off)
+
+    for skipped in range(covered, len(sections)):
+        async for item in fallback(skipped):
+            yield item
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count — about four characters per token for English prose."""
+    return len(text) // 4 + 1
+
+
+def pack_sections(contents: list[str], budget: int) -> list[list[int]]:
+    """Group consecutive short sections so each group fits in ``budget`` tokens.
+
+    Sections larger than half the budget always get a request of their own.
+    Returns groups of indices into ``contents``, in order.
+    """
+    groups: list[list[int]] = []
+    current: list[int] = []
+    used = 0
+
+    for i, content in enumerate(contents):
+        cost = _estimate_tokens(content)
+        if cost > budget // 2:
+            if current:
+                groups.append(current)
+                current, used = [], 0
+            groups.append([i])
+            continue
+        if current and used + cost > budget:
+            groups.append(current)
+            current, used = [], 0
+        current.append(i)
+        used += cost
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _parse_batch_response(text: str, expected: int) -> list[str] | None:
+    """Split a JSON batch reply into translations, or None if it's malformed."""
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        # Strip a markdown code fence around the JSON
+        cleaned = cleaned.split("\n", 1)[-1].rsplit("```", 1)[0]
+
+    try:
+        items = json.loads(cleaned)
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(items, list) or len(items) != expected:
+        return None
+    translations = [item.get("translated") if isinstance(item, dict) else None for item in items]
+    if not all(isinstance(t, str) for t in translations):
+        return None
+    return translations
+
+
+async def _request_group(
+    sections: list[Section],
+    tone: ToneLevel,
+    model: str | None,
+    llm: LLMProvider,
+    bucket: AsyncLeakyBucket | None = None,
+) -> list[str]:
+    """Translate a packed group of sections in one request.
+
+    Falls back to one request per section if the reply can't be split.
+    Those go out one at a time, each waiting on ``bucket``, so a failed
+    batch can't burst past the rate limit. The caller has already waited
+    on ``bucket`` for the first request.
+    """
+    if len(sections) == 1:
+        return [
+            await translate_section(
+                sections[0], tone=tone, model=model, provider=llm, use_cache=False
+            )
+        ]
+
+    reply = await llm.complete(
+        system=build_system_prompt(tone),
+        messages=[
+            Message(
+                role="user",
+                content=build_batch_prompt(
+                    [s.heading for s in sections], [s.content for s in sections]
+                ),
+            )
+        ],
+        model=model,
+        json_output=True,
+    )
+    translations = _parse_batch_response(reply, len(sections))
+    if translations is not None:
+        return translations
+
+    translations = []
+    for section in sections:
+        if bucket:
+            await bucket.acquire()
+        translations.append(
+            await translate_section(section, tone=tone, model=model, provider=llm, use_cache=False)
+        )
+    return translations
+
+
+async def _translate_group(
+    sections: list[Section],
+    tone: ToneLevel,
+    model: str | None,
+    llm: LLMProvider,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    bucket: AsyncLeakyBucket | None = None,
+) -> list[str]:
+    """Translate a group of sections, only requesting the ones not already cached.
+
+    The rate limiter is only consulted when a request actually goes out, so
+    cache hits come back immediately.
+    """
+    keys = [_cache_key(s, tone, model, llm) for s in sections] if use_cache else []
+    results: list[str | None] = [None] * len(sections)
+    if keys and not refresh_cache:
+        results = [cache.get(key) for key in keys]
+
+    todo = [i for i, text in enumerate(results) if text is None]
+    if todo:
+        if bucket:
+            await bucket.acquire()
+        texts = await _request_group([sections[i] for i in todo], tone, model, llm, bucket)
+        for i, text in zip(todo, texts):
+            results[i] = text
+            if keys:
+                cache.put(keys[i], text)
+
+    return results
+
+
+async def _translate_via_batch_job(
+    sections: list[Section],
+    tone: ToneLevel,
+    model: str | None,
+    llm: LLMProvider,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> list[str]:
+    """Translate uncached sections through a single provider batch job."""
+    keys = [_cache_key(s, tone, model, llm) for s in sections] if use_cache else []
+    results: list[str | None] = [None] * len(sections)
+    if keys and not refresh_cache:
+        results = [cache.get(key) for key in keys]
+
+    todo = [i for i, text in enumerate(results) if text is None]
+    if todo:
+        texts = await llm.batch_complete(
+            system=build_system_prompt(tone),
+            requests=[
+                [
+                    Message(
+                        role="user",
+                        content=build_section_prompt(sections[i].heading, sections[i].content),
+                    )
+                ]
+                for i in todo
+            ],
+            model=model,
+        )
+        for i, text in zip(todo, texts):
+            results[i] = text
+            if keys:
+                cache.put(keys[i], text)
+
+    return results
 
 
 async def translate_paper(
@@ -80,45 +549,128 @@ async def translate_paper(
     tone: ToneLevel = ToneLevel.BALANCED,
     model: str | None = None,
     provider_name: str | None = None,
+    provider: LLMProvider | None = None,
     on_section_start: callable | None = None,
     on_section_done: callable | None = None,
+    on_section_translated: callable | None = None,
+    max_concurrency: int | None = None,
+    rpm: int | None = None,
+    batch_budget: int | None = None,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+    use_batch_job: bool = False,
+    semaphore: asyncio.Semaphore | None = None,
+    rate_limiter: AsyncLeakyBucket | None = None,
 ) -> Paper:
     """Translate all sections of a paper.
 
-    Processes sections sequentially to provide clear progress feedback.
+    Sections are independent LLM calls, so they are dispatched concurrently
+    (at most ``max_concurrency`` in flight at once) and paced so no more than
+    ``rpm`` requests start per minute. Callbacks fire as each section starts
+    and finishes, which may be out of order. Sections that don't need
+    translation (see ``needs_translation``) keep their original text and only
+    fire ``on_section_translated``.
 
     Args:
         paper: The parsed paper.
         tone: Millennial intensity level.
         model: Model ID override.
         provider_name: Which LLM provider to use.
+        provider: A pre-configured LLMProvider to use. If omitted, the shared
+            instance for ``provider_name`` is used.
         on_section_start: Callback(section_index, heading) called before each section.
         on_section_done: Callback(section_index, heading) called after each section.
+        on_section_translated: Callback(section_index, section) called once the
+            section's ``translated`` text is set — use it to stream output.
+        max_concurrency: Maximum number of sections translated at the same time.
+            Defaults to the provider's recommended cap.
+        rpm: Requests-per-minute cap. Defaults to the provider's known rate
+            limit; pass 0 to disable throttling.
+        batch_budget: If set, pack consecutive short sections into shared
+            requests of up to this many tokens, each returning JSON.
+        use_cache: Reuse and store translations in the on-disk cache.
+        refresh_cache: Skip cache lookups but still store fresh results.
+        use_batch_job: Submit every section as one provider batch job instead
+            of live requests. Cheaper, but can take hours to complete.
+        semaphore: A shared concurrency limit (overrides ``max_concurrency``),
+            for translating several papers under one cap.
+        rate_limiter: A shared request pacer (overrides ``rpm``).
 
     Returns:
         The same Paper object with translated fields populated.
     """
-    llm = _resolve_provider(provider_name=provider_name)
+    name = provider.name if provider is not None else provider_name or DEFAULT_PROVIDER
+    llm = _resolve_provider(provider, name)
     all_sections = paper.all_sections()
+    sem = semaphore or asyncio.Semaphore(concurrency_for(name, max_concurrency))
+    bucket = rate_limiter or rate_limiter_for(name, rpm)
 
-    for i, section in enumerate(all_sections):
+    todo = [i for i, s in enumerate(all_sections) if needs_translation(s)]
+    if batch_budget:
+        packed = pack_sections([all_sections[i].content for i in todo], batch_budget)
+        groups = [[todo[j] for j in group] for group in packed]
+    else:
+        groups = [[i] for i in todo]
+
+    def _started(group: list[int]) -> None:
         if on_section_start:
-            on_section_start(i, section.heading)
+            for i in group:
+                on_section_start(i, all_sections[i].heading)
 
-        translated = await translate_section(
-            section, tone=tone, model=model, provider=llm
-        )
-        section.translated = translated
+    def _finished(group: list[int], texts: list[str]) -> None:
+        for i, text in zip(group, texts):
+            all_sections[i].translated = text
+            if on_section_done:
+                on_section_done(i, all_sections[i].heading)
+            if on_section_translated:
+                on_section_translated(i, all_sections[i])
 
-        if on_section_done:
-            on_section_done(i, section.heading)
+    async def _translate_one(group: list[int]) -> None:
+        async with sem:
+            _started(group)
+            texts = await _translate_group(
+                [all_sections[i] for i in group],
+                tone,
+                model,
+                llm,
+                use_cache=use_cache,
+                refresh_cache=refresh_cache,
+                bucket=bucket,
+            )
+            _finished(group, texts)
 
-    # Write translations back to paper
-    if paper.abstract and all_sections:
-        # First section was the abstract
-        paper.abstract = all_sections[0].translated or paper.abstract
-        paper.sections = all_sections[1:]
+    # Trivial sections pass through untouched and never fire start/done
+    for i, section in enumerate(all_sections):
+        if not needs_translation(section):
+            section.translated = section.content
+            if on_section_translated:
+                on_section_translated(i, section)
+
+    if use_batch_job and todo:
+        _started(todo)
+        texts = await _translate_via_batch_job(
+            [all_sections[i] for i in todo],
+            tone,
+            model,
+            llm,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+        )
+        _finished(todo, texts)
     else:
-        paper.sections = all_sections
+        # On the first failure, stop the other groups rather than letting
+        # them keep spending requests (and limiter slots) on a lost cause
+        tasks = [asyncio.create_task(_translate_one(group)) for group in groups]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Body sections are paper.sections' own objects, already updated in place;
+    # only the abstract was copied into a temporary Section
+    if paper.abstract:
+        paper.abstract = all_sections[0].translated or paper.abstract
 
     return paper
@@ -2,40 +2,147 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import FastAPI, Form, Request, UploadFile
 from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
-from millennialifier.models import ToneLevel
-from millennialifier.parsers.fetcher import fetch_paper
-from millennialifier.parsers.html import HtmlParser
-from millennialifier.parsers.pdf import PdfParser
+from millennialifier.concurrency import AsyncLeakyBucket
+from millennialifier.models import Paper, ToneLevel
+from millennialifier.parsers import close_client, fetch_paper, html_parser, pdf_parser
 from millennialifier.providers import (
     PROVIDER_INFO,
     ProviderNotConfiguredError,
     check_provider_configured,
+    close_providers,
+    get_provider,
 )
-from millennialifier.translator import translate_section_stream
+from millennialifier.translator import (
+    DEFAULT_STREAM_BATCH_BUDGET,
+    concurrency_for,
+    pack_sections,
+    rate_limiter_for,
+    translate_sections_stream,
+)
+
+# Optional [web] extra
+try:
+    from orjson import dumps as _json_bytes
+except ImportError:
+    def _json_bytes(data: dict) -> bytes:
+        return json.dumps(data).encode()
 
 _PROVIDER = "gemini"
 _MODEL = "gemini-2.0-flash"
 
+# Queue sentinel marking the end of a section's translation stream
+_SECTION_END = object()
+
+# Chunks buffered per section before its producer waits for the client to
+# catch up, so a slow reader can't make a request hold unbounded output
+_QUEUE_MAXSIZE = 64
+
+# Headers that keep proxies (e.g. nginx) and caches from buffering the stream
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Seconds of silence before sending a keep-alive comment, so proxies don't
+# time out the connection while a long section is still generating
+_PING_INTERVAL = 15.0
+_PING = b": ping\n\n"
+
+# Uploads are copied to disk in pieces this size rather than read whole
+_UPLOAD_CHUNK = 1 << 20
+
+# Streamed tokens are merged into one "chunk" event per this many seconds
+# (or characters, whichever comes first) to cut per-event write overhead
+_COALESCE_SECONDS = 0.02
+_COALESCE_CHARS = 4096
+
+# Pre-encoded "event:" lines, so each chunk only serializes its payload
+_SSE_PREFIX = {
+    name: f"event: {name}\ndata: ".encode()
+    for name in ("meta", "section_start", "chunk", "section_done", "done", "error")
+}
+
+# Known SDK error messages, one named group per kind of failure
+_ERR_RE = re.compile(
+    r"(?P<auth>api key not valid|invalid api key|unauthorized|401)"
+    r"|(?P<quota>quota|rate limit|429)"
+    r"|(?P<notfound>not found|404)",
+    re.IGNORECASE,
+)
+
 _ROOT = Path(__file__).resolve().parent.parent.parent
 _TEMPLATES = _ROOT / "templates"
 _STATIC = _ROOT / "static"
 
-app = FastAPI(title="Paper Millennial-ifier")
+# The page is plain HTML with no template variables, so it's read once and
+# served as-is
+_INDEX_HTML = (_TEMPLATES / "index.html").read_text(encoding="utf-8")
+
+
+# Set once the provider's config has passed a check; it can't change after
+_provider_ok = False
+
+
+def _provider_error() -> str | None:
+    """Return why the provider isn't usable, or None once its config checks out.
+
+    A successful check is remembered, so only a misconfigured server pays
+    for it again on the next request.
+    """
+    global _provider_ok
+    if not _provider_ok:
+        try:
+            check_provider_configured(_PROVIDER)
+        except (ProviderNotConfiguredError, ValueError) as exc:
+            return str(exc)
+        _provider_ok = True
+    return None
+
+
+# One concurrency cap and rate limiter for every request: they all share the
+# server's API key, so the provider's limits apply to the process as a whole
+_limits: tuple[asyncio.Semaphore, AsyncLeakyBucket | None] | None = None
+
+
+def _provider_limits() -> tuple[asyncio.Semaphore, AsyncLeakyBucket | None]:
+    """Return the shared semaphore and rate limiter, creating them on first use."""
+    global _limits
+    if _limits is None:
+        _limits = (asyncio.Semaphore(concurrency_for(_PROVIDER)), rate_limiter_for(_PROVIDER))
+    return _limits
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Check the provider config at startup; release shared clients at shutdown."""
+    global _limits
+    _provider_error()
+    yield
+    await close_client()
+    await close_providers()
+    _limits = None
+
+
+app = FastAPI(title="Paper Millennial-ifier", lifespan=_lifespan)
 app.mount("/static", StaticFiles(directory=str(_STATIC)), name="static")
-templates = Jinja2Templates(directory=str(_TEMPLATES))
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request) -> HTMLResponse:
-    return templates.TemplateResponse("index.html", {"request": request})
+async def index() -> HTMLResponse:
+    return HTMLResponse(_INDEX_HTML)
 
 
 @app.post("/translate")
@@ -52,94 +159,219 @@ async def translate(
     tone_level = ToneLevel(tone)
 
     # Validate API key before doing any work
-    try:
-        check_provider_configured(_PROVIDER)
-    except (ProviderNotConfiguredError, ValueError) as exc:
-        return StreamingResponse(
-            _error_stream(str(exc)),
-            media_type="text/event-stream",
-        )
+    error = _provider_error()
+    if error is not None:
+        return _event_response(_error_stream(error))
 
-    # Parse the paper from URL or uploaded file
+    # Parse the paper from URL or uploaded file. Parsing is CPU-bound, so it
+    # runs in a worker thread instead of stalling every other open stream.
     if file and file.filename:
-        data = await file.read()
         suffix = Path(file.filename).suffix.lower()
         if suffix == ".pdf":
-            paper = PdfParser().parse_bytes(data)
+            paper = await _parse_pdf_upload(file)
         else:
-            paper = HtmlParser().parse_string(data.decode("utf-8", errors="replace"))
+            data = await file.read()
+            html = data.decode("utf-8", errors="replace")
+            paper = await asyncio.to_thread(html_parser.parse_string, html)
     elif url:
         paper = await fetch_paper(url)
     else:
-        return StreamingResponse(
-            _error_stream("Please provide a URL or upload a file."),
-            media_type="text/event-stream",
-        )
+        return _event_response(_error_stream("Please provide a URL or upload a file."))
 
     async def event_stream():
+        sections = paper.all_sections()
+
         # Send paper metadata + provider info
         yield _sse(
             "meta",
             {
                 "title": paper.title,
                 "authors": paper.authors,
-                "section_count": len(paper.all_sections()),
+                "section_count": len(sections),
                 "provider": _PROVIDER,
                 "model": _MODEL,
             },
         )
 
+        # Translate sections concurrently, each into its own queue, then
+        # drain the queues in order so the frontend still sees one section
+        # at a time — later sections are already generating meanwhile. Runs
+        # of short sections share one streaming request.
+        try:
+            llm = get_provider(_PROVIDER)
+        except Exception as exc:
+            yield _sse("error", {"message": _friendly_error(_PROVIDER, exc)})
+            return
+
+        sem, bucket = _provider_limits()
+        queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=_QUEUE_MAXSIZE) for _ in sections]
+        groups = pack_sections([s.content for s in sections], DEFAULT_STREAM_BATCH_BUDGET)
+
+        async def produce(group: list[int]) -> None:
+            # A section is finished once the stream moves on to another one;
+            # any extra end markers left in a queue are never read.
+            try:
+                async with sem:
+                    current: int | None = None
+                    async for k, chunk in translate_sections_stream(
+                        [sections[i] for i in group],
+                        tone=tone_level,
+                        provider=llm,
+                        bucket=bucket,
+                    ):
+                        if current is not None and k != current:
+                            await queues[group[current]].put(_SECTION_END)
+                        current = k
+                        await queues[group[k]].put(chunk)
+                for i in group:
+                    await queues[i].put(_SECTION_END)
+            except Exception as exc:
+                for i in group:
+                    await queues[i].put(exc)
+
+        tasks = [asyncio.create_task(produce(group)) for group in groups]
         try:
-            for i, section in enumerate(paper.all_sections()):
+            for i, section in enumerate(sections):
                 yield _sse("section_start", {"index": i, "heading": section.heading})
 
-                async for chunk in translate_section_stream(
-                    section,
-                    tone=tone_level,
-                    provider_name=_PROVIDER,
-                ):
-                    yield _sse("chunk", {"index": i, "text": chunk})
+                async for item in _coalesce(queues[i]):
+                    if isinstance(item, Exception):
+                        yield _sse("error", {"message": _friendly_error(_PROVIDER, item)})
+                        return
+                    yield _sse("chunk", {"index": i, "text": item})
 
                 yield _sse("section_done", {"index": i, "heading": section.heading})
-        except Exception as exc:
-            yield _sse("error", {"message": _friendly_error(_PROVIDER, exc)})
+
+            yield _sse("done", {})
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return _event_response(event_stream())
+
+
+async def _coalesce(queue: asyncio.Queue) -> AsyncIterator[str | Exception]:
+    """Yield a section's queued chunks merged into batches, up to its end marker.
+
+    When the queue runs dry, waits one short window for more tokens before
+    flushing. An exception from the producer is yielded as-is and ends it.
+    """
+    held = None
+    while True:
+        item = held if held is not None else await queue.get()
+        held = None
+        if item is _SECTION_END:
+            return
+        if isinstance(item, Exception):
+            yield item
             return
 
-        yield _sse("done", {})
+        parts = [item]
+        size = len(item)
+        if size < _COALESCE_CHARS and queue.empty():
+            await asyncio.sleep(_COALESCE_SECONDS)
+        while size < _COALESCE_CHARS and not queue.empty():
+            item = queue.get_nowait()
+            if item is _SECTION_END or isinstance(item, Exception):
+                held = item  # Flush what we have first
+                break
+            parts.append(item)
+            size += len(item)
+        yield "".join(parts)
+
+
+async def _parse_pdf_upload(file: UploadFile) -> Paper:
+    """Parse an uploaded PDF in a worker thread, reading the upload in place."""
+    return await asyncio.to_thread(_parse_pdf_file, file.file)
 
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
+def _parse_pdf_file(upload: BinaryIO) -> Paper:
+    """Copy an upload's spooled file to a temp file in chunks and parse it by path.
 
-def _sse(event: str, data: dict) -> str:
+    PyMuPDF reads the file directly, so the upload is never held in memory
+    as one bytes object.
+    """
+    upload.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        shutil.copyfileobj(upload, tmp, _UPLOAD_CHUNK)
+    try:
+        return pdf_parser.parse(tmp.name)
+    finally:
+        os.unlink(tmp.name)
+
+
+def _sse(event: str, data: dict) -> bytes:
     """Format a server-sent event."""
-    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    return _SSE_PREFIX[event] + _json_bytes(data) + b"\n\n"
 
 
 async def _error_stream(message: str):
     yield _sse("error", {"message": message})
 
 
+def _event_response(events: AsyncIterator[bytes]) -> StreamingResponse:
+    """Wrap an SSE byte stream in an unbuffered, kept-alive response."""
+    return StreamingResponse(
+        _with_pings(events),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
+async def _with_pings(events: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Pass events through, sending a comment ping after each quiet interval."""
+
+    async def next_event() -> bytes:
+        return await anext(events)
+
+    pending = asyncio.ensure_future(next_event())
+    try:
+        while True:
+            done, _ = await asyncio.wait({pending}, timeout=_PING_INTERVAL)
+            if not done:
+                yield _PING
+                continue
+            try:
+                event = pending.result()
+            except StopAsyncIteration:
+                return
+            yield event
+            pending = asyncio.ensure_future(next_event())
+    finally:
+        # Client went away (or the stream ended): stop the inner generator so
+        # its own cleanup — cancelling translation tasks — runs now.
+        pending.cancel()
+        await asyncio.gather(pending, return_exceptions=True)
+        await events.aclose()
+
+
+@lru_cache(maxsize=None)
+def _env_hint(provider_name: str) -> str:
+    """The " (VAR or VAR)" note naming a provider's API key variables."""
+    info = PROVIDER_INFO.get(provider_name)
+    if not info or not info.api_key_env:
+        return ""
+    env_names = info.api_key_env if isinstance(info.api_key_env, list) else [info.api_key_env]
+    return f" ({' or '.join(env_names)})"
+
+
 def _friendly_error(provider_name: str, exc: Exception) -> str:
     """Turn a raw SDK exception into a human-readable message."""
-    raw = str(exc).lower()
-    info = PROVIDER_INFO.get(provider_name)
-    if info and info.api_key_env:
-        env_names = info.api_key_env if isinstance(info.api_key_env, list) else [info.api_key_env]
-        env_hint = f" ({' or '.join(env_names)})"
-    else:
-        env_hint = ""
+    kinds = {m.lastgroup for m in _ERR_RE.finditer(str(exc))}
+    env_hint = _env_hint(provider_name)
 
-    if "api key not valid" in raw or "invalid api key" in raw or "unauthorized" in raw or "401" in raw:
+    if "auth" in kinds:
         return (
             f"Your {provider_name} API key{env_hint} is invalid. "
             "Please double-check the key and try again."
         )
-    if "quota" in raw or "rate limit" in raw or "429" in raw:
+    if "quota" in kinds:
         return (
             f"Rate limit or quota exceeded for {provider_name}. "
             "Please wait a moment and try again."
         )
-    if "not found" in raw or "404" in raw:
+    if "notfound" in kinds:
         return (
             f"The requested model was not found on {provider_name}. "
             "Please check the model name or leave it blank for the default."
@@ -0,0 +1,18 @@
+"""Shared fixtures."""
+
+from __future__ import annotations
+
+import pytest
+
+from millennialifier import cache
+
+
+@pytest.fixture
+def temp_cache(tmp_path, monkeypatch):
+    """Point the translation cache at a fresh database."""
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "_CACHE_FILE", tmp_path / "translations.sqlite3")
+    monkeypatch.setattr(cache, "_conn", None)
+    yield
+    if cache._conn is not None:
+        cache._conn.close()
@@ -0,0 +1,40 @@
+"""Tests for the on-disk translation cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from millennialifier import cache
+
+
+pytestmark = pytest.mark.usefixtures("temp_cache")
+
+
+def test_miss():
+    assert cache.get("nope") is None
+
+
+def test_round_trip():
+    cache.put("k", "translated")
+    assert cache.get("k") == "translated"
+
+
+def test_empty_value_is_not_stored():
+    cache.put("k", "")
+    assert cache.get("k") is None
+
+
+def test_put_replaces():
+    cache.put("k", "old")
+    cache.put("k", "new")
+    assert cache.get("k") == "new"
+
+
+def test_key_depends_on_every_setting():
+    base = ("Intro", "text", 3, "model", "gemini", "prompt")
+    key = cache.make_key(*base)
+    assert cache.make_key(*base) == key
+    for i, changed in enumerate(("Other", "other", 4, "model-2", "other", "prompt v2")):
+        args = list(base)
+        args[i] = changed
+        assert cache.make_key(*args) != key
@@ -0,0 +1,39 @@
+"""Tests for the request rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from millennialifier.concurrency import AsyncLeakyBucket
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        AsyncLeakyBucket(0)
+
+
+@pytest.mark.asyncio
+async def test_first_request_is_immediate():
+    bucket = AsyncLeakyBucket(60)
+    start = monotonic()
+    await bucket.acquire()
+    assert monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_spaced_evenly():
+    bucket = AsyncLeakyBucket(1200)  # One slot every 50 ms
+    times: list[float] = []
+
+    async def request() -> None:
+        await bucket.acquire()
+        times.append(monotonic())
+
+    await asyncio.gather(*(request() for _ in range(4)))
+
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+    assert times[-1] - times[0] < 0.3
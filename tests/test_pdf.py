@@ -0,0 +1,92 @@
+"""Tests for heading detection in the PDF parser."""
+
+from __future__ import annotations
+
+import pymupdf
+
+from millennialifier.parsers.pdf import PdfParser
+
+BODY = "Body text that goes on long enough to make this the most common size."
+
+
+def _pdf(pages: list[list[tuple[str, float, bool]]]) -> bytes:
+    """Build a PDF with one (text, font size, bold) tuple per line."""
+    doc = pymupdf.open()
+    for lines in pages:
+        page = doc.new_page()
+        y = 60.0
+        for text, size, bold in lines:
+            page.insert_text((72, y), text, fontsize=size, fontname="hebo" if bold else "helv")
+            y += size + 4
+    return doc.tobytes()
+
+
+def _parse(pages: list[list[tuple[str, float, bool]]]):
+    return PdfParser().parse_bytes(_pdf(pages))
+
+
+def test_headings_by_font_size_and_weight():
+    paper = _parse([[
+        ("A Plain Paper", 18, False),
+        ("Alice Smith", 12, False),
+        ("Abstract", 12, True),
+        ("We do a thing and it works.", 10, False),
+        ("1 Introduction", 12, True),
+        (BODY, 10, False),
+        ("2 Method", 12, True),
+        ("2.1 Setup", 12, True),
+        (BODY, 10, False),
+        ("Definition 1. A thing is a thing.", 10, True),
+        (BODY, 10, False),
+        ("Table 1: Results", 10, True),
+        ("3 Results and Broader", 12, True),
+        ("Implications", 12, True),
+        (BODY, 10, False),
+    ]])
+
+    assert paper.title == "A Plain Paper"
+    assert paper.abstract == "We do a thing and it works."
+    assert [s.heading for s in paper.sections] == [
+        "Introduction",
+        "Method",
+        "Setup",
+        "Results And Broader Implications",
+    ]
+    setup = paper.sections[2].content
+    assert "Definition 1. A thing is a thing." in setup
+    assert setup.endswith("Table 1: Results")
+
+
+def test_styled_author_lines_do_not_hide_plain_headings():
+    paper = _parse([[
+        ("A Plain Paper", 18, False),
+        ("Alice Smith", 12, False),
+        ("Bob Jones", 12, False),
+        ("Abstract", 10, False),
+        ("We do a thing and it works.", 10, False),
+        *[
+            line
+            for heading in ("Introduction", "Methods", "Results", "Conclusion")
+            for line in ((heading, 10, False), (BODY, 10, False))
+        ],
+    ]])
+
+    assert paper.abstract == "We do a thing and it works."
+    assert [s.heading for s in paper.sections] == [
+        "Introduction",
+        "Methods",
+        "Results",
+        "Conclusion",
+    ]
+
+
+def test_title_in_body_size_keeps_the_first_page():
+    paper = _parse([
+        ([("A Plain Paper", 10, False)] if n == 0 else [])
+        + [(f"{n + 1} Topic {n + 1}", 10, True), (BODY, 10, False), (BODY, 10, False)]
+        for n in range(40)
+    ])
+
+    assert paper.title == "A Plain Paper"
+    assert len(paper.sections) == 40
+    assert paper.sections[0].heading == "Topic 1"
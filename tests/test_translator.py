@@ -0,0 +1,292 @@
+"""Tests for splitting, packing, and parsing in the translation engine."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections.abc import AsyncIterator
+
+import pytest
+
+from millennialifier.models import Paper, Section, ToneLevel
+from millennialifier.providers.base import LLMProvider, Message
+from millennialifier.translator import (
+    _parse_batch_response,
+    _SectionSplitter,
+    pack_sections,
+    translate_paper,
+    translate_sections_stream,
+)
+
+
+class TestPackSections:
+    # _estimate_tokens counts len // 4 + 1, so "x" * (4 * n - 4) costs n tokens
+    @staticmethod
+    def text(tokens: int) -> str:
+        return "x" * (4 * tokens - 4)
+
+    def test_empty(self):
+        assert pack_sections([], 100) == []
+
+    def test_packs_until_budget(self):
+        assert pack_sections([self.text(40)] * 3, 100) == [[0, 1], [2]]
+
+    def test_group_may_fill_budget_exactly(self):
+        assert pack_sections([self.text(50), self.text(50)], 100) == [[0, 1]]
+
+    def test_large_section_goes_alone(self):
+        contents = [self.text(10), self.text(51), self.text(10)]
+        assert pack_sections(contents, 100) == [[0], [1], [2]]
+
+
+class TestParseBatchResponse:
+    ITEMS = [{"heading": "A", "translated": "a"}, {"heading": "B", "translated": "b"}]
+
+    def test_plain_json(self):
+        assert _parse_batch_response(json.dumps(self.ITEMS), 2) == ["a", "b"]
+
+    def test_code_fence(self):
+        reply = "```json\n" + json.dumps(self.ITEMS) + "\n```"
+        assert _parse_batch_response(reply, 2) == ["a", "b"]
+
+    @pytest.mark.parametrize(
+        "reply",
+        [
+            "not json",
+            json.dumps({"heading": "A", "translated": "a"}),
+            json.dumps(ITEMS[:1]),
+            json.dumps([{"heading": "A"}, {"heading": "B", "translated": "b"}]),
+            json.dumps(["a", "b"]),
+        ],
+    )
+    def test_malformed(self, reply):
+        assert _parse_batch_response(reply, 2) is None
+
+
+def _split(chunks: list[str], count: int) -> dict[int, str]:
+    """Feed chunks through a splitter and join what each section received."""
+    splitter = _SectionSplitter(count)
+    texts: dict[int, str] = {}
+    for chunk in chunks:
+        for index, text in splitter.feed(chunk):
+            texts[index] = texts.get(index, "") + text
+    for index, text in splitter.close():
+        texts[index] = texts.get(index, "") + text
+    return texts
+
+
+REPLY = '<SECTION i="1">\nFirst one.\n</SECTION>\n<SECTION i="2">\nSecond one.\n</SECTION>\n'
+
+
+class TestSectionSplitter:
+    def test_whole_reply(self):
+        assert _split([REPLY], 2) == {0: "First one.", 1: "Second one."}
+
+    def test_one_character_at_a_time(self):
+        assert _split(list(REPLY), 2) == {0: "First one.", 1: "Second one."}
+
+    def test_tags_split_across_chunks(self):
+        chunks = ['<SEC', 'TION i="1">\nHello', " world</SEC", 'TION>\n<SECTION i="2">Bye</SECTION>']
+        assert _split(chunks, 2) == {0: "Hello world", 1: "Bye"}
+
+    def test_text_outside_tags_is_dropped(self):
+        reply = 'Sure! Here you go:\n<SECTION i="1">Hi</SECTION>\nHope that helps.'
+        assert _split([reply], 1) == {0: "Hi"}
+
+    def test_skipped_section(self):
+        reply = '<SECTION i="1">A</SECTION><SECTION i="3">C</SECTION>'
+        assert _split([reply], 3) == {0: "A", 2: "C"}
+
+    def test_out_of_order_section_is_ignored(self):
+        reply = '<SECTION i="2">B</SECTION><SECTION i="1">A</SECTION>'
+        assert _split([reply], 2) == {1: "B"}
+
+    def test_out_of_range_section_is_ignored(self):
+        reply = '<SECTION i="1">A</SECTION><SECTION i="5">E</SECTION>'
+        assert _split([reply], 2) == {0: "A"}
+
+    def test_unterminated_last_section_is_flushed(self):
+        assert _split(['<SECTION i="1">A</SECTION><SECTION i="2">cut o', "ff"], 2) == {
+            0: "A",
+            1: "cut off",
+        }
+
+
+class _TaggedProvider(LLMProvider):
+    """Streams a tagged reply that leaves out the given section headings."""
+
+    name = "fake"
+    default_model = "fake-1"
+
+    def __init__(self, skip: set[str]) -> None:
+        self.skip = skip
+        self.requests = 0
+
+    async def complete(self, system, messages, model=None, max_tokens=4096, json_output=False):
+        raise NotImplementedError
+
+    async def stream(
+        self, system: str, messages: list[Message], model=None, max_tokens=4096
+    ) -> AsyncIterator[str]:
+        self.requests += 1
+        prompt = messages[-1].content
+        tags = re.findall(r'<SECTION i="(\d+)">\n## Section: (.*)', prompt)
+        if tags:
+            reply = "".join(
+                f'<SECTION i="{i}">T[{heading}]</SECTION>\n'
+                for i, heading in tags
+                if heading not in self.skip
+            )
+        else:
+            reply = "S[" + re.search(r"## Section: (.*)", prompt).group(1) + "]"
+        for start in range(0, len(reply), 5):
+            yield reply[start:start + 5]
+
+
+@pytest.mark.asyncio
+async def test_stream_translates_skipped_sections_in_place():
+    sections = [Section(heading=f"H{i}", content="words " * 20) for i in range(4)]
+    llm = _TaggedProvider(skip={"H1", "H3"})
+
+    order: list[int] = []
+    texts: dict[int, str] = {}
+    async for index, text in translate_sections_stream(
+        sections, ToneLevel.BALANCED, provider=llm, use_cache=False
+    ):
+        if not order or order[-1] != index:
+            order.append(index)
+        texts[index] = texts.get(index, "") + text
+
+    assert order == [0, 1, 2, 3]
+    assert texts == {0: "T[H0]", 1: "S[H1]", 2: "T[H2]", 3: "S[H3]"}
+    assert llm.requests == 3
+
+
+class _SilentProvider(_TaggedProvider):
+    """Streams nothing at all, like a reply the provider blocked."""
+
+    async def stream(self, system, messages, model=None, max_tokens=4096):
+        self.requests += 1
+        return
+        yield
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("temp_cache")
+async def test_stream_with_no_text_yields_empty_sections_and_caches_nothing():
+    sections = [Section(heading=f"H{i}", content="words " * 20) for i in range(3)]
+
+    items = [
+        item
+        async for item in translate_sections_stream(
+            sections, ToneLevel.BALANCED, provider=_SilentProvider(skip=set())
+        )
+    ]
+    assert items == [(0, ""), (1, ""), (2, "")]
+
+    # Nothing was cached, so a second run asks the provider again
+    llm = _SilentProvider(skip=set())
+    [item async for item in translate_sections_stream(sections, ToneLevel.BALANCED, provider=llm)]
+    assert llm.requests > 0
+
+
+class _CountingBucket:
+    """Stands in for AsyncLeakyBucket, counting the slots taken."""
+
+    def __init__(self) -> None:
+        self.acquired = 0
+
+    async def acquire(self) -> None:
+        self.acquired += 1
+
+
+class _UntaggedProvider(_TaggedProvider):
+    """Ignores the tag format, so every section needs its own fallback request."""
+
+    async def stream(self, system, messages, model=None, max_tokens=4096):
+        self.requests += 1
+        prompt = messages[-1].content
+        yield "no tags here" if "<SECTION" in prompt else "solo"
+
+
+@pytest.mark.asyncio
+async def test_fallback_requests_wait_on_the_rate_limiter():
+    sections = [Section(heading=f"H{i}", content="words " * 20) for i in range(4)]
+    llm = _UntaggedProvider(skip=set())
+    bucket = _CountingBucket()
+
+    items = [
+        item
+        async for item in translate_sections_stream(
+            sections, ToneLevel.BALANCED, provider=llm, use_cache=False, bucket=bucket
+        )
+    ]
+
+    assert items == [(i, "solo") for i in range(4)]
+    assert llm.requests == 5
+    assert bucket.acquired == 5
+
+
+class _TruncatingProvider(_TaggedProvider):
+    """Stops the tagged reply partway through its last section."""
+
+    async def stream(self, system, messages, model=None, max_tokens=4096):
+        self.requests += 1
+        prompt = messages[-1].content
+        if "<SECTION" in prompt:
+            yield '<SECTION i="1">T[H0]</SECTION>\n<SECTION i="2">T[H1] cut o'
+        else:
+            yield "S[" + re.search(r"## Section: (.*)", prompt).group(1) + "]"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("temp_cache")
+async def test_section_cut_off_by_the_reply_end_is_not_cached():
+    sections = [Section(heading=f"H{i}", content="words " * 20) for i in range(2)]
+
+    first = [
+        item
+        async for item in translate_sections_stream(
+            sections, ToneLevel.BALANCED, provider=_TruncatingProvider(skip=set())
+        )
+    ]
+    assert first == [(0, "T[H0]"), (1, "T[H1] cut o")]
+
+    # Only the complete section was cached; the cut-off one is asked for again
+    llm = _TruncatingProvider(skip=set())
+    second = [
+        item
+        async for item in translate_sections_stream(sections, ToneLevel.BALANCED, provider=llm)
+    ]
+    assert second == [(0, "T[H0]"), (1, "S[H1]")]
+    assert llm.requests == 1
+
+
+class _FailingProvider(_TaggedProvider):
+    """Fails the first section at once; every other request takes a while."""
+
+    async def complete(self, system, messages, model=None, max_tokens=4096, json_output=False):
+        self.requests += 1
+        if "## Section: H0" in messages[-1].content:
+            raise RuntimeError("boom")
+        await asyncio.sleep(0.05)
+        return "ok"
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_the_other_sections():
+    paper = Paper(
+        title="T",
+        sections=[Section(heading=f"H{i}", content="words " * 20) for i in range(8)],
+    )
+    llm = _FailingProvider(skip=set())
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await translate_paper(paper, provider=llm, max_concurrency=2, rpm=0, use_cache=False)
+
+    # Long enough for any section still running to have finished and let
+    # the next ones start. Only H0, the section beside it, and at most the
+    # one that took H0's slot before the cancellation got to the provider.
+    await asyncio.sleep(0.3)
+    assert llm.requests <= 3
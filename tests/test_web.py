@@ -0,0 +1,138 @@
+"""Tests for the web app's streamed /translate endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from millennialifier import providers, web
+from millennialifier.providers.base import LLMProvider
+
+
+class _ScriptedProvider(LLMProvider):
+    """Streams ``reply(prompt)`` in small chunks, after ``delay(prompt)`` seconds."""
+
+    name = "gemini"
+    default_model = "fake-1"
+
+    def __init__(self, reply, delay=None) -> None:
+        self.reply = reply
+        self.delay = delay or (lambda prompt: 0)
+        self.in_flight = 0
+        self.peak = 0
+
+    async def complete(self, system, messages, model=None, max_tokens=4096, json_output=False):
+        raise NotImplementedError
+
+    async def stream(self, system, messages, model=None, max_tokens=4096):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay(messages[-1].content))
+            text = self.reply(messages[-1].content)
+            for start in range(0, len(text), 3):
+                await asyncio.sleep(0)
+                yield text[start:start + 3]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def use_provider(monkeypatch, temp_cache):
+    """Install a fake provider as the app's shared one, with no rate limit."""
+
+    def install(reply, delay=None) -> _ScriptedProvider:
+        llm = _ScriptedProvider(reply, delay)
+        monkeypatch.setenv("GOOGLE_API_KEY", "test")
+        monkeypatch.setitem(providers._instances, "gemini", llm)
+        monkeypatch.setattr(web, "_limits", (asyncio.Semaphore(4), None))
+        return llm
+
+    return install
+
+
+def _paper(count: int, words: int) -> bytes:
+    body = "".join(f"<h2>Sec {i}</h2><p>{'word ' * words}end{i}</p>" for i in range(count))
+    return f"<html><body>{body}</body></html>".encode()
+
+
+def _events(count: int, words: int = 20) -> list[tuple[str, dict]]:
+    with TestClient(web.app) as client:
+        response = client.post(
+            "/translate", files={"file": ("p.html", _paper(count, words), "text/html")}
+        )
+    events = []
+    for block in response.text.split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_silent_provider_still_finishes_the_stream(use_provider):
+    use_provider(lambda prompt: "")
+
+    events = _events(3)
+
+    names = [name for name, _ in events]
+    assert "error" not in names
+    assert names.count("section_done") == 3
+    assert names[-1] == "done"
+
+
+def test_sections_translate_concurrently_but_stream_in_order(use_provider):
+    def section_of(prompt: str) -> int:
+        return int(re.search(r"end(\d+)", prompt).group(1))
+
+    # Sections this long each get their own request; the first is the slowest
+    llm = use_provider(
+        lambda prompt: f"T{section_of(prompt)}",
+        delay=lambda prompt: 0.1 if section_of(prompt) == 0 else 0,
+    )
+
+    events = _events(3, words=1600)
+
+    assert llm.peak > 1
+    assert [name for name, _ in events if name != "chunk"] == [
+        "meta",
+        *["section_start", "section_done"] * 3,
+        "done",
+    ]
+    texts: dict[int, str] = {}
+    order: list[int] = []
+    for name, data in events:
+        if name == "chunk":
+            texts[data["index"]] = texts.get(data["index"], "") + data["text"]
+        elif name == "section_start":
+            order.append(data["index"])
+    assert order == [0, 1, 2]
+    assert texts == {0: "T0", 1: "T1", 2: "T2"}
+
+
+async def _drain(items: list) -> list:
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in items:
+        queue.put_nowait(item)
+    return [item async for item in web._coalesce(queue)]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_queued_chunks():
+    assert await _drain(["a", "b", "c", web._SECTION_END, "next"]) == ["abc"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_before_an_error():
+    error = RuntimeError("boom")
+    assert await _drain(["a", "b", error, "c"]) == ["ab", error]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_caps_batch_size():
+    chunk = "x" * (web._COALESCE_CHARS // 2)
+    batches = await _drain([chunk] * 4 + [web._SECTION_END])
+    assert batches == [chunk * 2, chunk * 2]